@@ -29,7 +29,8 @@ class TradingBot:
             log_to_file=config.logging.log_to_file,
             log_to_console=config.logging.log_to_console,
             log_level=config.logging.log_level,
-            enable_detailed=config.logging.enable_detailed_logging
+            enable_detailed=config.logging.enable_detailed_logging,
+            symbol_log_level=config.logging.symbol_log_level
         )
         
         self.logger.header("FiveMinScalper - Python Multi-Symbol Trading Bot")
@@ -108,6 +108,7 @@ class LoggingConfig:
     log_to_file: bool = True
     log_to_console: bool = True
     log_level: str = "INFO"
+    symbol_log_level: str = "DEBUG"  # Minimum level written to per-symbol log files
     log_active_trades_every_5min: bool = True
 
 
@@ -240,6 +241,16 @@ class TradingConfig:
         self.range_config = RangeConfigSettings(
             enabled=os.getenv('MULTI_RANGE_ENABLED', 'true').lower() == 'true'
         )
+
+        # Range evaluation order: comma-separated range IDs, first listed is checked first
+        # Ranges not listed keep their configured order after the listed ones
+        range_priority = [range_id.strip() for range_id in os.getenv('RANGE_PRIORITY', '').split(',')
+                          if range_id.strip()]
+        for range_cfg in self.range_config.ranges:
+            if range_cfg.range_id in range_priority:
+                range_cfg.priority = range_priority.index(range_cfg.range_id)
+            else:
+                range_cfg.priority = len(range_priority)
         
         # Logging
         self.logging = LoggingConfig(
@@ -247,6 +258,7 @@ class TradingConfig:
             log_to_file=os.getenv('LOG_TO_FILE', 'true').lower() == 'true',
             log_to_console=os.getenv('LOG_TO_CONSOLE', 'true').lower() == 'true',
             log_level=os.getenv('LOG_LEVEL', 'INFO'),
+            symbol_log_level=os.getenv('SYMBOL_LOG_LEVEL', 'DEBUG'),
             log_active_trades_every_5min=os.getenv('LOG_ACTIVE_TRADES_EVERY_5MIN', 'true').lower() == 'true'
         )
         
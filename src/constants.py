@@ -86,6 +86,9 @@ POSITION_MONITOR_INTERVAL: Final[int] = 1
 # Symbol worker tick interval in seconds
 SYMBOL_WORKER_TICK_INTERVAL: Final[int] = 1
 
+# Maximum worker threads for batched candle retrieval
+MAX_CANDLE_FETCH_WORKERS: Final[int] = 8
+
 
 # ============================================================================
 # TECHNICAL INDICATOR DEFAULTS
@@ -159,15 +162,6 @@ STRATEGY_TYPE_FALSE_BREAKOUT: Final[str] = "FB"  # False Breakout (reversal)
 STRATEGY_TYPE_TRUE_BREAKOUT: Final[str] = "TB"   # True Breakout (continuation)
 
 
-# ============================================================================
-# STRATEGY PARAMETERS
-# ============================================================================
-
-# Retest range percentage for true breakout strategy
-# Used to detect when price pulls back to test the breakout level
-RETEST_RANGE_PERCENT: Final[float] = 0.0005  # 0.05% range for retest detection
-
-
 # ============================================================================
 # RANGE IDENTIFIERS
 # ============================================================================
@@ -5,6 +5,7 @@ Manages connection to MT5 and provides real-time data for multiple symbols.
 import MetaTrader5 as mt5
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Tuple
 from src.models.data_models import CandleData, PositionInfo, PositionType
@@ -19,6 +20,7 @@ from src.constants import (
     ERROR_SYMBOL_NOT_FOUND,
     HISTORY_LOOKBACK_DAYS,
     CURRENCY_SEPARATORS,
+    MAX_CANDLE_FETCH_WORKERS,
 )
 
 
@@ -149,6 +151,32 @@ class MT5Connector:
             )
             return None
     
+    def get_candles_multi(self, symbol: str,
+                          requests: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Optional[pd.DataFrame]]:
+        """
+        Get historical candles for several (timeframe, count) pairs in parallel.
+
+        Each request is dispatched to a worker thread; the MT5 library releases
+        the GIL while copying rates, so the round-trips overlap.
+
+        Args:
+            symbol: Symbol name
+            requests: List of (timeframe, count) pairs; duplicates are fetched once
+
+        Returns:
+            Dictionary mapping each (timeframe, count) pair to its DataFrame (or None if error)
+        """
+        unique_requests = list(dict.fromkeys(requests))
+        if not unique_requests:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CANDLE_FETCH_WORKERS, len(unique_requests))) as executor:
+            results = executor.map(
+                lambda request: self.get_candles(symbol, request[0], count=request[1]),
+                unique_requests
+            )
+            return dict(zip(unique_requests, results))
+
     def get_latest_candle(self, symbol: str, timeframe: str) -> Optional[CandleData]:
         """
         Get the latest closed candle.
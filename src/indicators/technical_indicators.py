@@ -31,6 +31,21 @@ class TechnicalIndicators:
             Average volume
         """
         return self.volume_service.calculate_average_volume(volumes, period)
+
+    def calculate_average_volume_np(self, volumes: np.ndarray, period: int) -> float:
+        """
+        Calculate average volume over a period from a raw volume array.
+
+        Delegates to VolumeAnalysisService.
+
+        Args:
+            volumes: Array of volume data (oldest first)
+            period: Period for average
+
+        Returns:
+            Average volume
+        """
+        return self.volume_service.calculate_average_volume_np(volumes, period)
     
     def is_breakout_volume_low(self, breakout_volume: int, average_volume: float,
                                max_threshold: float, symbol: str) -> bool:
@@ -139,6 +154,32 @@ class TechnicalIndicators:
             check_type=VolumeCheckType.TRUE_BREAKOUT_HIGH
         )
 
+    def check_breakout_volume(self, breakout_volume: int, average_volume: float,
+                              min_threshold: Optional[float], max_threshold: Optional[float],
+                              symbol: str) -> Tuple[bool, bool]:
+        """
+        Check breakout volume for the TRUE (HIGH) and FALSE (LOW) strategies in one call.
+
+        Delegates to VolumeAnalysisService.
+
+        Args:
+            breakout_volume: Volume of breakout candle
+            average_volume: Average volume
+            min_threshold: Minimum threshold multiplier for HIGH volume (None skips the check)
+            max_threshold: Maximum threshold multiplier for LOW volume (None skips the check)
+            symbol: Symbol name for logging
+
+        Returns:
+            Tuple of (volume is high, volume is low)
+        """
+        return self.volume_service.check_breakout_volume(
+            current_volume=breakout_volume,
+            average_volume=average_volume,
+            min_threshold=min_threshold,
+            max_threshold=max_threshold,
+            symbol=symbol
+        )
+
     def is_continuation_volume_high(self, continuation_volume: int, average_volume: float,
                                    min_threshold: float, symbol: str) -> bool:
         """
@@ -181,9 +222,6 @@ class TechnicalIndicators:
         if len(df) < lookback + rsi_period:
             return False
         
-        # Calculate RSI
-        rsi = talib.RSI(df['close'].values, timeperiod=rsi_period)
-        
         # Find recent swing low (excluding current candle)
         lows = df['low'].values
         recent_low_idx = None
@@ -198,6 +236,9 @@ class TechnicalIndicators:
             self.logger.debug("No swing low found in lookback period", symbol)
             return False
         
+        # Calculate RSI (only needed once a swing point exists)
+        rsi = talib.RSI(df['close'].values, timeperiod=rsi_period)
+        
         # Current low (last closed candle)
         current_low = lows[-2]
         previous_low = lows[recent_low_idx]
@@ -242,9 +283,6 @@ class TechnicalIndicators:
         if len(df) < lookback + rsi_period:
             return False
         
-        # Calculate RSI
-        rsi = talib.RSI(df['close'].values, timeperiod=rsi_period)
-        
         # Find recent swing high (excluding current candle)
         highs = df['high'].values
         recent_high_idx = None
@@ -259,6 +297,9 @@ class TechnicalIndicators:
             self.logger.debug("No swing high found in lookback period", symbol)
             return False
         
+        # Calculate RSI (only needed once a swing point exists)
+        rsi = talib.RSI(df['close'].values, timeperiod=rsi_period)
+        
         # Current high (last closed candle)
         current_high = highs[-2]
         previous_high = highs[recent_high_idx]
@@ -4,8 +4,9 @@ Volume Analysis Service
 Provides volume analysis and comparison utilities to eliminate duplication
 in volume checking logic across TechnicalIndicators and strategy engines.
 """
+import numpy as np
 import pandas as pd
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Tuple, TYPE_CHECKING
 from enum import Enum
 from src.constants import DEFAULT_VOLUME_PERIOD, MIN_DATA_POINTS_VOLUME
 
@@ -70,6 +71,31 @@ class VolumeAnalysisService:
         
         avg_volume = volumes.tail(period).mean()
         return float(avg_volume)
+
+    def calculate_average_volume_np(
+        self,
+        volumes: np.ndarray,
+        period: int = DEFAULT_VOLUME_PERIOD
+    ) -> float:
+        """
+        Calculate average volume over a period from a raw volume array.
+
+        Same result as calculate_average_volume without building a pandas Series.
+
+        Args:
+            volumes: Array of volume data (oldest first)
+            period: Period for average (default from constants)
+
+        Returns:
+            Average volume, or 0.0 if insufficient data
+        """
+        if len(volumes) < period:
+            self.logger.warning(
+                f"Not enough data for volume average: {len(volumes)} < {period}"
+            )
+            return 0.0
+
+        return float(volumes[-period:].mean())
     
     def calculate_volume_ratio(
         self,
@@ -179,6 +205,67 @@ class VolumeAnalysisService:
         
         return is_high
     
+    def check_breakout_volume(
+        self,
+        current_volume: int,
+        average_volume: float,
+        min_threshold: Optional[float],
+        max_threshold: Optional[float],
+        symbol: str
+    ) -> Tuple[bool, bool]:
+        """
+        Check a breakout candle's volume for both breakout strategies at once.
+
+        The volume ratio is computed once and compared against the TRUE breakout
+        minimum (want HIGH) and the FALSE breakout maximum (want LOW). Each check
+        is logged the same way as is_volume_high / is_volume_low.
+
+        Args:
+            current_volume: Breakout candle volume
+            average_volume: Average volume
+            min_threshold: Minimum threshold multiplier for HIGH volume (None skips the check)
+            max_threshold: Maximum threshold multiplier for LOW volume (None skips the check)
+            symbol: Symbol name for logging
+
+        Returns:
+            Tuple of (volume is high, volume is low); a skipped check returns False
+        """
+        if average_volume <= 0:
+            self.logger.warning("Average volume is zero or negative", symbol)
+            return False, False
+
+        volume_ratio = current_volume / average_volume
+
+        is_high = False
+        if min_threshold is not None:
+            is_high = volume_ratio >= min_threshold
+            self._log_volume_check(
+                check_type=VolumeCheckType.TRUE_BREAKOUT_HIGH,
+                current_volume=current_volume,
+                average_volume=average_volume,
+                volume_ratio=volume_ratio,
+                threshold=min_threshold,
+                result=is_high,
+                condition=VolumeCondition.HIGH,
+                symbol=symbol
+            )
+
+        is_low = False
+        if max_threshold is not None:
+            is_low = volume_ratio <= max_threshold
+            self._log_volume_check(
+                check_type=VolumeCheckType.BREAKOUT_LOW,
+                current_volume=current_volume,
+                average_volume=average_volume,
+                volume_ratio=volume_ratio,
+                threshold=max_threshold,
+                result=is_low,
+                condition=VolumeCondition.LOW,
+                symbol=symbol
+            )
+
+        return is_high, is_low
+    
     def _log_volume_check(
         self,
         check_type: VolumeCheckType,
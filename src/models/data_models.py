@@ -2,10 +2,20 @@
 Data models for the trading system.
 Ported from MQL5 structures in FMS_Config.mqh and FMS_GlobalVars.mqh
 """
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime, time
 from enum import Enum
-from typing import Optional, List, Dict
+from typing import Final, Optional, List, Dict, Tuple
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Retest/continuation distances as a fraction of the candle high/low.
+# Defined here rather than in src.constants so the models import without MetaTrader5.
+RETEST_RANGE_PERCENT: Final[float] = 0.0005  # 0.05% range for retest detection
+CONTINUATION_RANGE_PERCENT: Final[float] = 0.001  # 0.1% beyond 4H high/low
 
 
 class SymbolCategory(Enum):
@@ -155,7 +165,7 @@ class PositionInfo:
         return self.current_pnl / self.risk
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CandleData:
     """OHLCV candle data"""
     time: datetime
@@ -211,6 +221,9 @@ class RangeConfig:
     # ATR configuration for this range
     atr_timeframe: Optional[str] = None  # ATR timeframe (e.g., "M5", "M1") - defaults to breakout_timeframe if None
 
+    # Evaluation order when checking ranges for signals (lower first, ties keep configured order)
+    priority: int = 0
+
     def __str__(self) -> str:
         """String representation for logging"""
         if self.use_specific_time and self.reference_time:
@@ -218,7 +231,7 @@ class RangeConfig:
         return f"{self.range_id} ({self.reference_timeframe} -> {self.breakout_timeframe})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class UnifiedBreakoutState:
     """
     Unified breakout state tracking.
@@ -231,11 +244,13 @@ class UnifiedBreakoutState:
     breakout_above_detected: bool = False
     breakout_above_volume: int = 0
     breakout_above_time: Optional[datetime] = None
+    breakout_above_time_ts: float = 0.0  # breakout_above_time as a POSIX timestamp (set by mark_breakout_above)
 
     # Breakout below 4H low
     breakout_below_detected: bool = False
     breakout_below_volume: int = 0
     breakout_below_time: Optional[datetime] = None
+    breakout_below_time_ts: float = 0.0  # breakout_below_time as a POSIX timestamp (set by mark_breakout_below)
 
     # === STAGE 2: STRATEGY CLASSIFICATION ===
     # FALSE BREAKOUT - Reversal from BELOW (BUY signal)
@@ -282,6 +297,18 @@ class UnifiedBreakoutState:
         """Check if there's an active breakout being tracked"""
         return self.breakout_above_detected or self.breakout_below_detected
 
+    def classification_pending(self) -> bool:
+        """Check if a detected breakout side still has no qualified strategy"""
+        return ((self.breakout_above_detected and
+                 not self.true_buy_qualified and not self.false_sell_qualified) or
+                (self.breakout_below_detected and
+                 not self.true_sell_qualified and not self.false_buy_qualified))
+
+    def any_strategy_qualified(self) -> bool:
+        """Check if any strategy has qualified and is waiting for its signal"""
+        return (self.true_buy_qualified or self.false_sell_qualified or
+                self.true_sell_qualified or self.false_buy_qualified)
+
     def both_strategies_rejected(self) -> bool:
         """Check if both strategies have rejected the current setup"""
         if self.breakout_above_detected:
@@ -292,11 +319,72 @@ class UnifiedBreakoutState:
             return self.true_sell_rejected and self.false_buy_rejected
         return False
 
+    def qualify_true_buy(self, volume_ok: bool):
+        """Qualify TRUE BUY for a breakout above, tracking whether its volume was high"""
+        self.true_buy_qualified = True
+        self.true_buy_volume_ok = volume_ok
+
+    def qualify_true_sell(self, volume_ok: bool):
+        """Qualify TRUE SELL for a breakout below, tracking whether its volume was high"""
+        self.true_sell_qualified = True
+        self.true_sell_volume_ok = volume_ok
+
+    def qualify_false_buy(self, volume_ok: bool, divergence_ok: bool):
+        """Qualify FALSE BUY for a breakout below, tracking low volume and divergence"""
+        self.false_buy_qualified = True
+        self.false_buy_volume_ok = volume_ok
+        self.false_buy_divergence_ok = divergence_ok
+
+    def qualify_false_sell(self, volume_ok: bool, divergence_ok: bool):
+        """Qualify FALSE SELL for a breakout above, tracking low volume and divergence"""
+        self.false_sell_qualified = True
+        self.false_sell_volume_ok = volume_ok
+        self.false_sell_divergence_ok = divergence_ok
+
+    def true_buy_confirmations(self) -> Tuple[bool, bool]:
+        """TRUE BUY (volume confirmed, divergence confirmed); divergence is not used for true breakouts"""
+        # Volume confirmed = breakout volume HIGH + retest occurred + continuation volume HIGH
+        return (self.true_buy_volume_ok and self.true_buy_retest_ok and
+                self.true_buy_continuation_volume_ok), False
+
+    def true_sell_confirmations(self) -> Tuple[bool, bool]:
+        """TRUE SELL (volume confirmed, divergence confirmed); divergence is not used for true breakouts"""
+        # Volume confirmed = breakout volume HIGH + retest occurred + continuation volume HIGH
+        return (self.true_sell_volume_ok and self.true_sell_retest_ok and
+                self.true_sell_continuation_volume_ok), False
+
+    def false_buy_confirmations(self) -> Tuple[bool, bool]:
+        """FALSE BUY (volume confirmed, divergence confirmed)"""
+        # Volume confirmed = breakout volume LOW + reversal volume HIGH
+        return (self.false_buy_volume_ok and self.false_buy_reversal_volume_ok,
+                self.false_buy_divergence_ok)
+
+    def false_sell_confirmations(self) -> Tuple[bool, bool]:
+        """FALSE SELL (volume confirmed, divergence confirmed)"""
+        # Volume confirmed = breakout volume LOW + reversal volume HIGH
+        return (self.false_sell_volume_ok and self.false_sell_reversal_volume_ok,
+                self.false_sell_divergence_ok)
+
+    def mark_breakout_above(self, breakout_time: datetime, volume: int):
+        """Record a breakout above the range, with its time as a POSIX timestamp for age checks"""
+        self.breakout_above_detected = True
+        self.breakout_above_volume = volume
+        self.breakout_above_time = breakout_time
+        self.breakout_above_time_ts = breakout_time.timestamp()
+
+    def mark_breakout_below(self, breakout_time: datetime, volume: int):
+        """Record a breakout below the range, with its time as a POSIX timestamp for age checks"""
+        self.breakout_below_detected = True
+        self.breakout_below_volume = volume
+        self.breakout_below_time = breakout_time
+        self.breakout_below_time_ts = breakout_time.timestamp()
+
     def reset_breakout_above(self):
         """Reset breakout above 4H high"""
         self.breakout_above_detected = False
         self.breakout_above_volume = 0
         self.breakout_above_time = None
+        self.breakout_above_time_ts = 0.0
         # Reset associated strategies
         self.true_buy_qualified = False
         self.true_buy_retest_detected = False
@@ -319,6 +407,7 @@ class UnifiedBreakoutState:
         self.breakout_below_detected = False
         self.breakout_below_volume = 0
         self.breakout_below_time = None
+        self.breakout_below_time_ts = 0.0
         # Reset associated strategies
         self.true_sell_qualified = False
         self.true_sell_retest_detected = False
@@ -337,9 +426,13 @@ class UnifiedBreakoutState:
         self.false_buy_rejected = False
 
     def reset_all(self):
-        """Reset all tracking"""
-        self.reset_breakout_above()
-        self.reset_breakout_below()
+        """Reset all tracking (every field back to its default)"""
+        for name, value in _UNIFIED_STATE_DEFAULTS.items():
+            setattr(self, name, value)
+
+
+# Field defaults of UnifiedBreakoutState (all immutable), used for bulk reset
+_UNIFIED_STATE_DEFAULTS = {f.name: f.default for f in fields(UnifiedBreakoutState)}
 
 
 @dataclass
@@ -488,7 +581,7 @@ class BreakoutState:
         self.reset_true_sell()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ReferenceCandle:
     """
     Generic reference candle for range-based breakout detection.
@@ -501,6 +594,13 @@ class ReferenceCandle:
     close: float
     timeframe: str  # e.g., "H4", "M15"
     is_processed: bool = False
+    # Retest tolerance around the high/low, derived on construction
+    retest_tol_high: float = field(init=False, default=0.0)
+    retest_tol_low: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        self.retest_tol_high = self.high * RETEST_RANGE_PERCENT
+        self.retest_tol_low = self.low * RETEST_RANGE_PERCENT
 
     @property
     def range(self) -> float:
@@ -511,7 +611,7 @@ class ReferenceCandle:
         return self.close > self.open
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FourHourCandle:
     """
     4-Hour candle tracking.
@@ -524,6 +624,17 @@ class FourHourCandle:
     open: float
     close: float
     is_processed: bool = False
+    # Retest tolerance and continuation levels, derived from high/low on construction
+    retest_tol_high: float = field(init=False, default=0.0)
+    retest_tol_low: float = field(init=False, default=0.0)
+    continuation_high: float = field(init=False, default=0.0)
+    continuation_low: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        self.retest_tol_high = self.high * RETEST_RANGE_PERCENT
+        self.retest_tol_low = self.low * RETEST_RANGE_PERCENT
+        self.continuation_high = self.high * (1 + CONTINUATION_RANGE_PERCENT)
+        self.continuation_low = self.low * (1 - CONTINUATION_RANGE_PERCENT)
 
     @property
     def range(self) -> float:
@@ -547,9 +658,9 @@ class AdaptiveFilterState:
     last_closed_ticket: int = 0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TradeSignal:
-    """Trade signal information"""
+    """Trade signal information (slotted, one is built per generated signal)"""
     symbol: str
     signal_type: PositionType
     entry_price: float
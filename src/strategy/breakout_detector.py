@@ -73,9 +73,7 @@ class BreakoutDetector:
         
         if open_inside_range and close_above_high:
             # Update state
-            state.breakout_above_detected = True
-            state.breakout_above_volume = candle.volume
-            state.breakout_above_time = candle.time
+            state.mark_breakout_above(candle.time, candle.volume)
             
             # Log breakout event
             self._log_breakout_above(
@@ -124,9 +122,7 @@ class BreakoutDetector:
         
         if open_inside_range and close_below_low:
             # Update state
-            state.breakout_below_detected = True
-            state.breakout_below_volume = candle.volume
-            state.breakout_below_time = candle.time
+            state.mark_breakout_below(candle.time, candle.volume)
             
             # Log breakout event
             self._log_breakout_below(
@@ -0,0 +1,63 @@
+"""
+Breakout Side Specifications
+
+Describes the two breakout sides shared by StrategyEngine and
+MultiRangeStrategyEngine, so both engines classify a breakout through the
+same tables instead of keeping their own copies.
+
+A breakout above the reference high can become a TRUE BUY (continuation) or a
+FALSE SELL (reversal); a breakout below the reference low can become a
+TRUE SELL or a FALSE BUY.
+"""
+from dataclasses import dataclass
+from typing import Callable, Tuple
+from src.models.data_models import UnifiedBreakoutState
+
+
+@dataclass(frozen=True)
+class ClassificationSide:
+    """Strategies a breakout side can qualify for, with the state setters that qualify them"""
+    qualify_true: Callable[[UnifiedBreakoutState, bool], None]  # (state, volume_ok)
+    qualify_false: Callable[[UnifiedBreakoutState, bool, bool], None]  # (state, volume_ok, divergence_ok)
+    true_label: str
+    false_label: str
+    true_waiting_message: str
+    false_waiting_message: str
+    bullish_divergence: bool
+
+
+def build_classification_sides(high_level: str,
+                               low_level: str) -> Tuple[ClassificationSide, ClassificationSide]:
+    """
+    Build the above/below classification sides for an engine.
+
+    Args:
+        high_level: Name of the broken high used in log messages (e.g., "4H High")
+        low_level: Name of the broken low used in log messages (e.g., "4H Low")
+
+    Returns:
+        Tuple of (above side, below side)
+    """
+    # Breakout above: TRUE BUY / FALSE SELL
+    above = ClassificationSide(
+        qualify_true=UnifiedBreakoutState.qualify_true_buy,
+        qualify_false=UnifiedBreakoutState.qualify_false_sell,
+        true_label="TRUE BUY",
+        false_label="FALSE SELL",
+        true_waiting_message=f"Waiting for continuation above {high_level}...",
+        false_waiting_message=f"Waiting for reversal back below {high_level}...",
+        bullish_divergence=False
+    )
+
+    # Breakout below: TRUE SELL / FALSE BUY
+    below = ClassificationSide(
+        qualify_true=UnifiedBreakoutState.qualify_true_sell,
+        qualify_false=UnifiedBreakoutState.qualify_false_buy,
+        true_label="TRUE SELL",
+        false_label="FALSE BUY",
+        true_waiting_message=f"Waiting for continuation below {low_level}...",
+        false_waiting_message=f"Waiting for reversal back above {low_level}...",
+        bullish_divergence=True
+    )
+
+    return above, below
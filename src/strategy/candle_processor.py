@@ -2,12 +2,18 @@
 Candle processing and detection logic.
 Ported from FMS_CandleProcessing.mqh
 """
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict
 import pandas as pd
 from src.models.data_models import CandleData, FourHourCandle
 from src.core.mt5_connector import MT5Connector
 from src.utils.logger import get_logger
+from src.constants import SYMBOL_WORKER_TICK_INTERVAL
+
+# 5M frames are reused within one worker tick (the strategy checks and
+# divergence ask for the same history while handling one candle)
+_5M_CACHE_TTL_SECONDS: float = SYMBOL_WORKER_TICK_INTERVAL / 2
 
 
 class CandleProcessor:
@@ -34,6 +40,10 @@ class CandleProcessor:
         # Current 4H candle
         self.current_4h_candle: Optional[FourHourCandle] = None
 
+        # Recently fetched 5M frames
+        # Format: {count: (monotonic_fetch_time, DataFrame)}
+        self._5m_cache: Dict[int, Tuple[float, pd.DataFrame]] = {}
+
         # Initialize with existing 4H candle on startup
         self._initialize_4h_candle()
 
@@ -130,7 +140,7 @@ class CandleProcessor:
     
     def get_5m_candles(self, count: int = 100) -> Optional[pd.DataFrame]:
         """
-        Get historical 5M candles.
+        Get historical 5M candles (shared for the rest of the current worker tick).
         
         Args:
             count: Number of candles to retrieve
@@ -138,7 +148,15 @@ class CandleProcessor:
         Returns:
             DataFrame with candle data or None
         """
-        return self.connector.get_candles(self.symbol, 'M5', count=count)
+        now = time.monotonic()
+        cached = self._5m_cache.get(count)
+        if cached is not None and now - cached[0] < _5M_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        df = self.connector.get_candles(self.symbol, 'M5', count=count)
+        if df is not None:
+            self._5m_cache[count] = (now, df)
+        return df
     
     def get_current_4h_candle(self) -> Optional[FourHourCandle]:
         """
@@ -2,12 +2,43 @@
 Multi-range candle processing and detection logic.
 Supports multiple independent range configurations operating simultaneously.
 """
-from datetime import datetime, timedelta, timezone, time as dt_time
-from typing import Optional, Dict, List
+import logging
+import time
+from datetime import timedelta, timezone, time as dt_time
+from typing import Callable, Optional, Dict, List, Tuple
+import numpy as np
 import pandas as pd
 from src.models.data_models import CandleData, ReferenceCandle, RangeConfig
 from src.core.mt5_connector import MT5Connector
 from src.utils.logger import get_logger
+from src.utils.timeframe_converter import TimeframeConverter
+from src.constants import (
+    SYMBOL_WORKER_TICK_INTERVAL,
+    LOG_SEPARATOR_CHAR,
+    LOG_SEPARATOR_LENGTH,
+    MINUTES_PER_DAY,
+)
+
+
+# Initialization lookback per reference timeframe, sized to cover at least 24 hours
+# Hours:   max(10, 24 / hours + 5)          -> H1 = 29, H4 = 11
+# Minutes: max(100, 1440 / minutes + 10)    -> M15 = 106, M5 = 298, M1 = 1450
+_TF_LOOKBACK: Dict[str, int] = {
+    'M1': 1450,
+    'M5': 298,
+    'M15': 106,
+    'M30': 100,
+    'H1': 29,
+    'H4': 11,
+}
+
+# Fraction of the reference timeframe before the next expected close at which
+# reference polling resumes (absorbs late first ticks on the broker side)
+_REF_POLL_EARLY_FRACTION: float = 0.1
+
+# How long a fetched candle DataFrame is reused for identical (timeframe, count) requests.
+# Kept below one worker tick so cached data never outlives the poll that fetched it.
+_CANDLE_CACHE_TTL_SECONDS: float = SYMBOL_WORKER_TICK_INTERVAL / 2
 
 
 class MultiRangeCandleProcessor:
@@ -19,6 +50,17 @@ class MultiRangeCandleProcessor:
     - Different reference times (e.g., 04:00, 04:30)
     - Different breakout timeframes (e.g., 5M, 1M)
     """
+
+    _SEP = LOG_SEPARATOR_CHAR * LOG_SEPARATOR_LENGTH
+    _REF_BANNER_FMT = (
+        "%s\n"
+        "*** %s [%s] ***\n"
+        "Time: %s\n"
+        "High: %.5f\n"
+        "Low: %.5f\n"
+        "Range: %.5f points\n"
+        "%s"
+    )
     
     def __init__(self, symbol: str, connector: MT5Connector, range_configs: List[RangeConfig]):
         """
@@ -32,15 +74,34 @@ class MultiRangeCandleProcessor:
         self.symbol = symbol
         self.connector = connector
         self.range_configs = {config.range_id: config for config in range_configs}
+        # Range IDs in evaluation order (by priority, ties keep configured order)
+        self._range_ids: Tuple[str, ...] = tuple(
+            sorted(self.range_configs, key=lambda range_id: self.range_configs[range_id].priority)
+        )
         self.logger = get_logger()
 
         # Track last processed candles per range configuration
-        # Format: {range_id: {timeframe: last_candle_time}}
-        self.last_candle_times: Dict[str, Dict[str, Optional[datetime]]] = {}
+        # Times are stored as int64 nanoseconds since epoch (Timestamp.value) so the
+        # per-poll "is this candle new" check is a plain integer comparison
+        # Format: {range_id: {timeframe: last_candle_time_ns}}
+        self.last_candle_times: Dict[str, Dict[str, Optional[int]]] = {}
         
         # Current reference candles per range configuration
         # Format: {range_id: ReferenceCandle}
         self.current_reference_candles: Dict[str, Optional[ReferenceCandle]] = {}
+
+        # Range IDs that currently have a reference candle
+        self._ranges_with_ref: set = set()
+
+        # Per-poll candle cache shared by all ranges
+        # Format: {(timeframe, count): (fetch_monotonic_time, DataFrame)}
+        self._candles_cache: Dict[Tuple[str, int], Tuple[float, pd.DataFrame]] = {}
+
+        # Reference poll throttling per range configuration
+        # The last closed reference candle seen by any poll (ns since epoch), and the
+        # epoch time before which the next reference candle cannot have closed
+        self._last_seen_ref_times: Dict[str, Optional[int]] = {}
+        self._next_ref_poll: Dict[str, float] = {}
         
         # Initialize tracking for each range
         for range_id in self.range_configs:
@@ -49,6 +110,14 @@ class MultiRangeCandleProcessor:
                 'breakout': None
             }
             self.current_reference_candles[range_id] = None
+            self._last_seen_ref_times[range_id] = None
+            self._next_ref_poll[range_id] = 0.0
+
+        # Reference candle detector per range, specialized on its detection mode
+        self._ref_detectors: Dict[str, Callable[[], bool]] = {
+            range_id: self._make_reference_detector(range_id, config)
+            for range_id, config in self.range_configs.items()
+        }
         
         # Initialize all ranges
         self._initialize_all_ranges()
@@ -63,54 +132,79 @@ class MultiRangeCandleProcessor:
         Returns:
             True if new reference candle detected
         """
-        if range_id not in self.range_configs:
+        detector = self._ref_detectors.get(range_id)
+        if detector is None:
             return False
-        
-        config = self.range_configs[range_id]
-        
-        # Get latest reference candle
-        df = self.connector.get_candles(self.symbol, config.reference_timeframe, count=2)
-        if df is None or len(df) < 2:
-            return False
-        
-        # Get the last closed candle
-        last_candle = df.iloc[-2]
-        candle_time = last_candle['time']
-        
-        # Check if this is a new candle
-        last_time = self.last_candle_times[range_id]['reference']
-        if last_time is None or candle_time > last_time:
-            # If using specific time, verify it matches
-            if config.use_specific_time and config.reference_time:
-                if candle_time.hour == config.reference_time.hour and candle_time.minute == config.reference_time.minute:
-                    self.last_candle_times[range_id]['reference'] = candle_time
-                    self._update_reference_candle(range_id, last_candle, config.reference_timeframe)
-                    
-                    self.logger.info("=" * 60, self.symbol)
-                    self.logger.info(f"*** NEW REFERENCE CANDLE DETECTED [{config}] ***", self.symbol)
-                    self.logger.info(f"Time: {candle_time}", self.symbol)
-                    self.logger.info(f"High: {last_candle['high']:.5f}", self.symbol)
-                    self.logger.info(f"Low: {last_candle['low']:.5f}", self.symbol)
-                    self.logger.info(f"Range: {self.current_reference_candles[range_id].range:.5f} points", self.symbol)
-                    self.logger.info("=" * 60, self.symbol)
-                    
-                    return True
-            else:
-                # Use any candle of this timeframe
-                self.last_candle_times[range_id]['reference'] = candle_time
-                self._update_reference_candle(range_id, last_candle, config.reference_timeframe)
-                
-                self.logger.info("=" * 60, self.symbol)
-                self.logger.info(f"*** NEW REFERENCE CANDLE DETECTED [{config}] ***", self.symbol)
-                self.logger.info(f"Time: {candle_time}", self.symbol)
-                self.logger.info(f"High: {last_candle['high']:.5f}", self.symbol)
-                self.logger.info(f"Low: {last_candle['low']:.5f}", self.symbol)
-                self.logger.info(f"Range: {self.current_reference_candles[range_id].range:.5f} points", self.symbol)
-                self.logger.info("=" * 60, self.symbol)
-                
-                return True
-        
-        return False
+        return detector()
+    
+    def _make_reference_detector(self, range_id: str, config: RangeConfig) -> Callable[[], bool]:
+        """
+        Build the reference candle detector for a range.
+
+        Whether the range waits for a specific candle time or accepts any candle
+        never changes after construction, so the branch is resolved once here and
+        the returned closure only does the work its mode needs.
+
+        Args:
+            range_id: Range configuration identifier
+            config: Range configuration
+
+        Returns:
+            Zero-argument callable returning True if a new reference candle was detected
+        """
+        timeframe = config.reference_timeframe
+        track_dict = self.last_candle_times[range_id]
+
+        def poll() -> Optional[Tuple[pd.Timestamp, float, float, float, float]]:
+            # The next reference candle cannot have closed yet - skip the MT5 request
+            if time.time() < self._next_ref_poll[range_id]:
+                return None
+
+            # Get latest reference candle
+            df = self._get_candles(timeframe, 2)
+            if df is None or len(df) < 2:
+                return None
+
+            # Get the last closed candle
+            row = self._row_at(df, -2)
+            candle_time_ns = row[0].value
+            self._schedule_next_ref_poll(range_id, config, candle_time_ns)
+
+            # Check if this is a new candle
+            last_time_ns = track_dict['reference']
+            if last_time_ns is not None and candle_time_ns <= last_time_ns:
+                return None
+            return row
+
+        def accept(row: Tuple[pd.Timestamp, float, float, float, float]) -> bool:
+            candle_time, open_, high, low, close = row
+            track_dict['reference'] = candle_time.value
+            self._update_reference_candle(range_id, candle_time, open_, high, low, close, timeframe)
+            self._log_reference_banner("NEW REFERENCE CANDLE DETECTED", config, range_id)
+            return True
+
+        if config.use_specific_time and config.reference_time:
+            target_hm = (config.reference_time.hour, config.reference_time.minute)
+
+            def _detect_ref_specific() -> bool:
+                row = poll()
+                if row is None:
+                    return False
+                # Only the candle at the configured time is a reference candle
+                if (row[0].hour, row[0].minute) != target_hm:
+                    return False
+                return accept(row)
+
+            return _detect_ref_specific
+
+        def _detect_ref_any() -> bool:
+            # Use any candle of this timeframe
+            row = poll()
+            if row is None:
+                return False
+            return accept(row)
+
+        return _detect_ref_any
     
     def is_new_breakout_candle(self, range_id: str) -> bool:
         """
@@ -122,26 +216,26 @@ class MultiRangeCandleProcessor:
         Returns:
             True if new breakout candle detected
         """
-        if range_id not in self.range_configs:
+        config = self.range_configs.get(range_id)
+        if config is None:
             return False
         
-        config = self.range_configs[range_id]
-        
         # Get latest breakout candle
-        df = self.connector.get_candles(self.symbol, config.breakout_timeframe, count=2)
+        df = self._get_candles(config.breakout_timeframe, 2)
         if df is None or len(df) < 2:
             return False
         
         # Get the last closed candle
-        last_candle = df.iloc[-2]
-        candle_time = last_candle['time']
+        candle_time = df['time'].iat[-2]
+        candle_time_ns = candle_time.value
         
         # Check if this is a new candle
-        last_time = self.last_candle_times[range_id]['breakout']
-        if last_time is None or candle_time > last_time:
-            self.last_candle_times[range_id]['breakout'] = candle_time
+        last_time_ns = self.last_candle_times[range_id]['breakout']
+        if last_time_ns is None or candle_time_ns > last_time_ns:
+            self.last_candle_times[range_id]['breakout'] = candle_time_ns
             
-            self.logger.debug(f"New breakout candle for {config} at {candle_time}", self.symbol)
+            if self.logger.isEnabledFor(logging.DEBUG, self.symbol):
+                self.logger.debug(f"New breakout candle for {config} at {candle_time}", self.symbol)
             
             return True
         
@@ -157,11 +251,24 @@ class MultiRangeCandleProcessor:
         Returns:
             CandleData object or None
         """
-        if range_id not in self.range_configs:
+        config = self.range_configs.get(range_id)
+        if config is None:
             return None
-        
-        config = self.range_configs[range_id]
-        return self.connector.get_latest_candle(self.symbol, config.breakout_timeframe)
+        df = self._get_candles(config.breakout_timeframe, 2)
+        if df is None or len(df) < 2:
+            return None
+
+        # Get the second-to-last candle (last closed candle)
+        candle_time, open_, high, low, close = self._row_at(df, -2)
+
+        return CandleData(
+            time=candle_time,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            volume=int(df['tick_volume'].iat[-2])
+        )
     
     def get_breakout_candles(self, range_id: str, count: int = 100) -> Optional[pd.DataFrame]:
         """
@@ -174,11 +281,26 @@ class MultiRangeCandleProcessor:
         Returns:
             DataFrame with candle data or None
         """
-        if range_id not in self.range_configs:
+        config = self.range_configs.get(range_id)
+        if config is None:
             return None
-        
-        config = self.range_configs[range_id]
-        return self.connector.get_candles(self.symbol, config.breakout_timeframe, count=count)
+        return self._get_candles(config.breakout_timeframe, count)
+
+    def get_breakout_volumes(self, range_id: str, count: int = 100) -> Optional[np.ndarray]:
+        """
+        Get historical breakout candle tick volumes for a specific range.
+
+        Args:
+            range_id: Range configuration identifier
+            count: Number of candles to retrieve
+
+        Returns:
+            Array of tick volumes (oldest first) or None
+        """
+        df = self.get_breakout_candles(range_id, count)
+        if df is None:
+            return None
+        return df['tick_volume'].to_numpy()
     
     def get_current_reference_candle(self, range_id: str) -> Optional[ReferenceCandle]:
         """
@@ -202,81 +324,128 @@ class MultiRangeCandleProcessor:
         Returns:
             True if reference candle is available
         """
-        return self.current_reference_candles.get(range_id) is not None
+        return range_id in self._ranges_with_ref
 
-    def get_all_range_ids(self) -> List[str]:
+    def get_all_range_ids(self) -> Tuple[str, ...]:
         """
         Get all configured range IDs.
 
         Returns:
-            List of range identifiers
+            Tuple of range identifiers in priority order (cached, do not rebuild per call)
         """
-        return list(self.range_configs.keys())
+        return self._range_ids
     
+    def _get_candles(self, timeframe: str, count: int) -> Optional[pd.DataFrame]:
+        """
+        Get candles through the per-poll cache.
+
+        Ranges sharing a timeframe (and the several lookups made for one range
+        during a single poll) are served from one MT5 request.
+
+        Args:
+            timeframe: Timeframe string (e.g., "H4", "M5")
+            count: Number of candles to retrieve
+
+        Returns:
+            DataFrame with candle data or None
+        """
+        key = (timeframe, count)
+        now = time.monotonic()
+
+        cached = self._candles_cache.get(key)
+        if cached is not None and now - cached[0] < _CANDLE_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        df = self.connector.get_candles(self.symbol, timeframe, count=count)
+        if df is not None:
+            self._candles_cache[key] = (now, df)
+        return df
+
+    def _schedule_next_ref_poll(self, range_id: str, config: RangeConfig, candle_time_ns: int):
+        """
+        Throttle reference polling once a reference candle close has been observed.
+
+        The next close is projected from the candle open time: the last closed
+        candle opened at T, so the forming one closes at T + 2 * duration. This
+        does not drift when the rollover is noticed late. The wait is capped at
+        one duration from now in case the broker clock runs ahead of local time.
+        Until such a rollover has been seen, every poll goes through.
+
+        Args:
+            range_id: Range configuration identifier
+            config: Range configuration
+            candle_time_ns: Open time of the last closed reference candle (ns since epoch)
+        """
+        last_seen_ns = self._last_seen_ref_times[range_id]
+        self._last_seen_ref_times[range_id] = candle_time_ns
+
+        if last_seen_ns is None or candle_time_ns == last_seen_ns:
+            return
+
+        minutes = TimeframeConverter.get_duration_minutes(config.reference_timeframe)
+        if minutes is None:
+            return
+
+        duration = minutes * 60
+        early = duration * _REF_POLL_EARLY_FRACTION
+        next_close = candle_time_ns / 1e9 + 2 * duration
+        self._next_ref_poll[range_id] = min(next_close, time.time() + duration) - early
+
     def _initialize_all_ranges(self):
         """Initialize all range configurations on startup."""
+        # Fetch every (timeframe, count) needed by any range in one parallel batch
+        requests = []
+        for config in self.range_configs.values():
+            requests.append((config.reference_timeframe, _TF_LOOKBACK.get(config.reference_timeframe, 100)))
+            requests.append((config.breakout_timeframe, 2))
+        candles = self.connector.get_candles_multi(self.symbol, requests)
+
         for range_id, config in self.range_configs.items():
-            self._initialize_reference_candle(range_id, config)
-            self._initialize_breakout_candle(range_id, config)
+            self._initialize_reference_candle(range_id, config, candles)
+            self._initialize_breakout_candle(range_id, config, candles)
     
-    def _initialize_reference_candle(self, range_id: str, config: RangeConfig):
+    def _initialize_reference_candle(self, range_id: str, config: RangeConfig,
+                                     candles: Dict[Tuple[str, int], Optional[pd.DataFrame]]):
         """
         Initialize with the most recent valid reference candle for a specific range.
 
         Args:
             range_id: Range configuration identifier
             config: Range configuration
+            candles: Prefetched candles keyed by (timeframe, count)
         """
-        # Calculate lookback count based on timeframe to cover at least 24 hours
-        # For H4: 24 hours / 4 hours = 6 candles, use 10 for safety
-        # For M15: 24 hours / 15 minutes = 96 candles, use 100 for safety
-        if config.reference_timeframe.startswith('H'):
-            hours = int(config.reference_timeframe[1:])
-            lookback_count = max(10, int(24 / hours) + 5)
-        elif config.reference_timeframe.startswith('M'):
-            minutes = int(config.reference_timeframe[1:])
-            lookback_count = max(100, int((24 * 60) / minutes) + 10)
-        else:
-            lookback_count = 100  # Default
+        # Lookback count covers at least 24 hours of reference candles
+        lookback_count = _TF_LOOKBACK.get(config.reference_timeframe, 100)
 
         # Get recent reference candles
-        df = self.connector.get_candles(self.symbol, config.reference_timeframe, count=lookback_count)
+        df = candles.get((config.reference_timeframe, lookback_count))
         if df is None or len(df) < 2:
             self.logger.warning(f"Could not retrieve {config.reference_timeframe} candles for initialization [{config}]", self.symbol)
             return
 
-        # Search backwards for the most recent valid candle
-        for i in range(1, min(lookback_count, len(df))):
-            candle = df.iloc[-(i+1)]  # Get candle from end, skipping current
-            candle_time = candle['time']
-
-            if config.use_specific_time and config.reference_time:
-                # Check if this matches the specific time
-                if candle_time.hour == config.reference_time.hour and candle_time.minute == config.reference_time.minute:
-                    self.last_candle_times[range_id]['reference'] = candle_time
-                    self._update_reference_candle(range_id, candle, config.reference_timeframe)
-
-                    self.logger.info("=" * 60, self.symbol)
-                    self.logger.info(f"*** INITIALIZED WITH REFERENCE CANDLE [{config}] ***", self.symbol)
-                    self.logger.info(f"Time: {candle_time}", self.symbol)
-                    self.logger.info(f"High: {candle['high']:.5f}", self.symbol)
-                    self.logger.info(f"Low: {candle['low']:.5f}", self.symbol)
-                    self.logger.info(f"Range: {self.current_reference_candles[range_id].range:.5f} points", self.symbol)
-                    self.logger.info("=" * 60, self.symbol)
-                    return
-            else:
-                # Use the most recent closed candle
-                self.last_candle_times[range_id]['reference'] = candle_time
-                self._update_reference_candle(range_id, candle, config.reference_timeframe)
-
-                self.logger.info("=" * 60, self.symbol)
-                self.logger.info(f"*** INITIALIZED WITH REFERENCE CANDLE [{config}] ***", self.symbol)
-                self.logger.info(f"Time: {candle_time}", self.symbol)
-                self.logger.info(f"High: {candle['high']:.5f}", self.symbol)
-                self.logger.info(f"Low: {candle['low']:.5f}", self.symbol)
-                self.logger.info(f"Range: {self.current_reference_candles[range_id].range:.5f} points", self.symbol)
-                self.logger.info("=" * 60, self.symbol)
-                return
+        self._last_seen_ref_times[range_id] = df['time'].iat[-2].value
+
+        # Candidate rows: every closed candle in the lookback window (skip the current one)
+        start = len(df) - min(lookback_count, len(df))
+        end = len(df) - 1
+
+        if config.use_specific_time and config.reference_time:
+            # Most recent candle whose open time matches the specific time of day
+            minutes_of_day = df['time'].to_numpy()[start:end].astype('datetime64[m]').view('i8') % MINUTES_PER_DAY
+            target_minutes = config.reference_time.hour * 60 + config.reference_time.minute
+            matches = np.flatnonzero(minutes_of_day == target_minutes)
+            index = start + int(matches[-1]) if matches.size else None
+        else:
+            # Use the most recent closed candle
+            index = end - 1 if end > start else None
+
+        if index is not None:
+            row = self._row_at(df, index)
+            self.last_candle_times[range_id]['reference'] = row[0].value
+            self._update_reference_candle(range_id, *row, config.reference_timeframe)
+
+            self._log_reference_banner("INITIALIZED WITH REFERENCE CANDLE", config, range_id)
+            return
 
         # If we get here and use_specific_time is True, we didn't find a valid candle
         if config.use_specific_time:
@@ -285,16 +454,18 @@ class MultiRangeCandleProcessor:
                 self.symbol
             )
     
-    def _initialize_breakout_candle(self, range_id: str, config: RangeConfig):
+    def _initialize_breakout_candle(self, range_id: str, config: RangeConfig,
+                                    candles: Dict[Tuple[str, int], Optional[pd.DataFrame]]):
         """
         Initialize breakout candle tracking on startup for a specific range.
 
         Args:
             range_id: Range configuration identifier
             config: Range configuration
+            candles: Prefetched candles keyed by (timeframe, count)
         """
         # Get latest breakout candle
-        df = self.connector.get_candles(self.symbol, config.breakout_timeframe, count=2)
+        df = candles.get((config.breakout_timeframe, 2))
         if df is None or len(df) < 2:
             self.logger.warning(f"Could not retrieve {config.breakout_timeframe} candles for initialization [{config}]", self.symbol)
             return
@@ -304,28 +475,70 @@ class MultiRangeCandleProcessor:
         candle_time = last_candle['time']
 
         # Set as last processed to skip it
-        self.last_candle_times[range_id]['breakout'] = candle_time
+        self.last_candle_times[range_id]['breakout'] = candle_time.value
 
         self.logger.info(f"Breakout candle tracking initialized for {config} at {candle_time}", self.symbol)
         self.logger.info("Will only process NEW candles that form after this time", self.symbol)
     
-    def _update_reference_candle(self, range_id: str, candle_data, timeframe: str):
+    def _log_reference_banner(self, event: str, config: RangeConfig, range_id: str):
+        """
+        Log the reference candle banner as a single multi-line message.
+
+        Args:
+            event: Banner title (e.g., "NEW REFERENCE CANDLE DETECTED")
+            config: Range configuration
+            range_id: Range configuration identifier
+        """
+        candle = self.current_reference_candles[range_id]
+        self.logger.info_lazy(
+            self._REF_BANNER_FMT,
+            self._SEP, event, config, candle.time, candle.high, candle.low, candle.range, self._SEP,
+            symbol=self.symbol
+        )
+
+    @staticmethod
+    def _row_at(df: pd.DataFrame, index: int) -> Tuple[pd.Timestamp, float, float, float, float]:
+        """
+        Extract (time, open, high, low, close) for one row as plain scalars.
+
+        Args:
+            df: DataFrame with candle data
+            index: Positional row index (negative values count from the end)
+
+        Returns:
+            Tuple of (time, open, high, low, close)
+        """
+        return (
+            df['time'].iat[index],
+            float(df['open'].iat[index]),
+            float(df['high'].iat[index]),
+            float(df['low'].iat[index]),
+            float(df['close'].iat[index]),
+        )
+
+    def _update_reference_candle(self, range_id: str, candle_time: pd.Timestamp, open_: float,
+                                 high: float, low: float, close: float, timeframe: str):
         """
         Update the current reference candle for a specific range.
 
         Args:
             range_id: Range configuration identifier
-            candle_data: Pandas Series with candle data
+            candle_time: Candle open time
+            open_: Open price
+            high: High price
+            low: Low price
+            close: Close price
             timeframe: Timeframe string (e.g., "H4", "M15")
         """
         self.current_reference_candles[range_id] = ReferenceCandle(
-            time=candle_data['time'],
-            open=candle_data['open'],
-            high=candle_data['high'],
-            low=candle_data['low'],
-            close=candle_data['close'],
+            time=candle_time,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
             timeframe=timeframe
         )
+        self._ranges_with_ref.add(range_id)
     
     def reset_reference_candle(self, range_id: str):
         """
@@ -336,9 +549,5 @@ class MultiRangeCandleProcessor:
         """
         if range_id in self.current_reference_candles:
             self.current_reference_candles[range_id] = None
+            self._ranges_with_ref.discard(range_id)
             self.logger.info(f"Reference candle reset for {self.range_configs[range_id]}", self.symbol)
-    
-    def get_all_range_ids(self) -> List[str]:
-        """Get list of all range configuration IDs."""
-        return list(self.range_configs.keys())
-
@@ -2,7 +2,9 @@
 Multi-range strategy engine for breakout detection.
 Supports multiple independent range configurations operating simultaneously.
 """
-from typing import Optional, List
+import logging
+from dataclasses import dataclass
+from typing import Callable, Optional, List, Dict, Tuple
 from datetime import datetime, timezone, timedelta
 import pandas as pd
 from src.models.data_models import (
@@ -10,12 +12,74 @@ from src.models.data_models import (
     TradeSignal, PositionType, SymbolParameters, RangeConfig
 )
 from src.strategy.multi_range_candle_processor import MultiRangeCandleProcessor
+from src.strategy.breakout_sides import ClassificationSide, build_classification_sides
 from src.indicators.technical_indicators import TechnicalIndicators
 from src.strategy.signal_generator import SignalGenerator
 from src.config.config import StrategyConfig
 from src.utils.logger import get_logger
 from src.utils.timeframe_converter import TimeframeConverter
-from src.constants import RETEST_RANGE_PERCENT
+from src.constants import (
+    MINUTES_PER_DAY, SECONDS_PER_MINUTE, LOG_SEPARATOR_CHAR, LOG_SEPARATOR_LENGTH
+)
+
+
+def _take_profit(entry: float, stop_loss: float, risk_reward_ratio: float) -> float:
+    """
+    Take profit at risk_reward_ratio times the entry-to-SL distance.
+
+    The signed distance places TP on the correct side for both BUY and SELL.
+
+    Args:
+        entry: Entry price
+        stop_loss: Stop loss price
+        risk_reward_ratio: Reward multiple of the risk
+
+    Returns:
+        Take profit price
+    """
+    return entry + (entry - stop_loss) * risk_reward_ratio
+
+
+# Breakout above: TRUE BUY / FALSE SELL, below: TRUE SELL / FALSE BUY
+_ABOVE_SIDE, _BELOW_SIDE = build_classification_sides("reference high", "reference low")
+
+
+@dataclass(frozen=True)
+class _SignalSide:
+    """Direction-specific parts of signal generation"""
+    position_type: PositionType
+    label: str
+    direction: int  # +1: SL below the entry (BUY), -1: SL above the entry (SELL)
+    true_confirmations: Callable[[UnifiedBreakoutState], Tuple[bool, bool]]  # (volume, divergence) confirmed
+    false_confirmations: Callable[[UnifiedBreakoutState], Tuple[bool, bool]]
+    extreme_label: str
+
+
+_BUY_SIGNAL = _SignalSide(
+    position_type=PositionType.BUY,
+    label="BUY",
+    direction=1,
+    true_confirmations=UnifiedBreakoutState.true_buy_confirmations,
+    false_confirmations=UnifiedBreakoutState.false_buy_confirmations,
+    extreme_label="lowest low"
+)
+
+_SELL_SIGNAL = _SignalSide(
+    position_type=PositionType.SELL,
+    label="SELL",
+    direction=-1,
+    true_confirmations=UnifiedBreakoutState.true_sell_confirmations,
+    false_confirmations=UnifiedBreakoutState.false_sell_confirmations,
+    extreme_label="highest high"
+)
+
+
+@dataclass(frozen=True)
+class _RestrictedWindow:
+    """Minutes of the day during which a range's reference candle forms"""
+    start_minutes: int  # Minutes since midnight
+    end_minutes: int  # Minutes since midnight, wrapped past midnight
+    bitmap: bytes  # One bit per minute of the day, set while trading is restricted
 
 
 class MultiRangeStrategyEngine:
@@ -27,6 +91,59 @@ class MultiRangeStrategyEngine:
     - Strategy classification
     - Signal generation
     """
+
+    _SEP = LOG_SEPARATOR_CHAR * LOG_SEPARATOR_LENGTH
+    _BREAKOUT_BANNER_FMT = (
+        "%s\n"
+        ">>> BREAKOUT %s DETECTED [%s] <<<\n"
+        "Breakout Open: %.5f (inside range ✓)\n"
+        "Breakout Close: %.5f (%s ✓)\n"
+        "Reference High: %.5f\n"
+        "Reference Low: %.5f\n"
+        "Reference Time: %s\n"
+        "Breakout Time: %s\n"
+        "Breakout Volume: %s\n"
+        "Timeout at: %s\n"
+        "%s"
+    )
+    _TIMEOUT_BANNER_FMT = (
+        "%s\n"
+        ">>> BREAKOUT %s TIMEOUT [%s] - Resetting <<<\n"
+        "Breakout Age: %d minutes\n"
+        "Timeout Limit: %d minutes\n"
+        "%s"
+    )
+    _REVERSAL_DETECTED_FMT = (
+        ">>> %s REVERSAL DETECTED [%s] (Rev Vol %s) <<<\n"
+        "Breakout Close: %.5f\n"
+        "%s: %.5f\n"
+        "Reversal Volume: %s\n"
+        "Waiting for next candle to confirm reversal direction..."
+    )
+    _REVERSAL_CONFIRMED_FMT = (
+        ">>> %s REVERSAL CONFIRMED [%s] <<<\n"
+        "Confirmation Close: %.5f\n"
+        "%s: %.5f\n"
+        "*** %s SIGNAL GENERATED [%s] ***"
+    )
+    _REVERSAL_FAILED_FMT = (
+        ">>> %s REVERSAL FAILED [%s] - Price back %s <<<\n"
+        "Resetting %s state..."
+    )
+    _RETEST_DETECTED_FMT = (
+        ">>> %s RETEST DETECTED [%s] <<<\n"
+        "Breakout Close: %.5f\n"
+        "%s: %.5f\n"
+        "Retest Range: %.5f"
+    )
+    _CONTINUATION_DETECTED_FMT = (
+        ">>> %s CONTINUATION DETECTED [%s] (Cont Vol %s) <<<\n"
+        "Breakout Close: %.5f\n"
+        "%s: %.5f\n"
+        "Continuation Volume: %s\n"
+        "*** %s SIGNAL GENERATED [%s] ***"
+    )
+    _RANGE_RESET_FMT = "Range state reset for %s"
     
     def __init__(self, symbol: str, candle_processor: MultiRangeCandleProcessor,
                  indicators: TechnicalIndicators, strategy_config: StrategyConfig,
@@ -60,6 +177,88 @@ class MultiRangeStrategyEngine:
 
         # Multi-range breakout state tracking
         self.multi_range_state = MultiRangeBreakoutState()
+
+        # Average breakout volume per range, valid for one breakout candle
+        # Format: {range_id: (breakout_candle_time, avg_volume)}
+        self._avg_vol_cache: Dict[str, Tuple[datetime, float]] = {}
+
+        # Per-range restricted windows and breakout timeouts (configs are static)
+        # Only ranges with a specific reference time have a restricted window.
+        self._restricted_windows: Dict[str, _RestrictedWindow] = {}
+        self._timeout_minutes: Dict[str, int] = {}
+        self._timeout_seconds: Dict[str, int] = {}
+        self._timeout_deltas: Dict[str, timedelta] = {}
+        self._precompute_range_timing()
+
+        # Signal constants read on every generated signal
+        # strategy_config and symbol_params are not modified after construction
+        self._rr = float(self.strategy_config.risk_reward_ratio)
+        self._max_spread = self.symbol_params.max_spread_percent
+
+        # Signal reason strings, built once per (range_id, is_true_breakout)
+        self._reasons: Dict[Tuple[str, bool], str] = {}
+        for range_id in self.candle_processor.range_configs:
+            self._signal_reason(range_id, True)
+            self._signal_reason(range_id, False)
+
+    def _signal_reason(self, range_id: str, is_true_breakout: bool) -> str:
+        """
+        Get the trade signal reason for a range, building it on first use.
+
+        Args:
+            range_id: Range identifier
+            is_true_breakout: True for a true breakout signal, False for a false breakout
+
+        Returns:
+            Reason string shared by all signals of this kind
+        """
+        key = (range_id, is_true_breakout)
+        reason = self._reasons.get(key)
+        if reason is None:
+            reason = f"{'True' if is_true_breakout else 'False'} breakout strategy - Range: {range_id}"
+            self._reasons[key] = reason
+        return reason
+
+    def _precompute_range_timing(self):
+        """Compute the per-range restricted windows and timeouts used on every check."""
+        timeout_candles = self.symbol_params.breakout_timeout_candles
+        for range_id, config in self.candle_processor.range_configs.items():
+            # Trading is suspended while a specific-time reference candle forms.
+            # Only hour and minute reference timeframes restrict trading.
+            if (config.use_specific_time and config.reference_time and
+                    config.reference_timeframe.startswith(('H', 'M'))):
+                duration_minutes = TimeframeConverter.get_duration_minutes(config.reference_timeframe)
+                if duration_minutes is not None:
+                    ref_start = config.reference_time.hour * 60 + config.reference_time.minute
+                    self._restricted_windows[range_id] = _RestrictedWindow(
+                        start_minutes=ref_start,
+                        end_minutes=(ref_start + duration_minutes) % MINUTES_PER_DAY,
+                        bitmap=self._build_restricted_bitmap(ref_start, duration_minutes)
+                    )
+
+            minutes_per_candle = TimeframeConverter.get_minutes_per_candle(config.breakout_timeframe)
+            timeout_minutes = timeout_candles * minutes_per_candle
+            self._timeout_minutes[range_id] = timeout_minutes
+            self._timeout_seconds[range_id] = timeout_minutes * SECONDS_PER_MINUTE
+            self._timeout_deltas[range_id] = timedelta(minutes=timeout_minutes)
+
+    @staticmethod
+    def _build_restricted_bitmap(start_minutes: int, duration_minutes: int) -> bytes:
+        """
+        Build a minute-of-day bitmap with the restricted minutes set.
+
+        Args:
+            start_minutes: Reference candle start in minutes since midnight
+            duration_minutes: Reference candle duration in minutes
+
+        Returns:
+            Bitmap of MINUTES_PER_DAY bits, bit N set if minute N is restricted
+        """
+        bitmap = bytearray((MINUTES_PER_DAY + 7) // 8)
+        for offset in range(min(duration_minutes, MINUTES_PER_DAY)):
+            minute = (start_minutes + offset) % MINUTES_PER_DAY
+            bitmap[minute >> 3] |= 1 << (minute & 7)
+        return bytes(bitmap)
     
     def check_for_signal(self) -> Optional[TradeSignal]:
         """
@@ -70,43 +269,55 @@ class MultiRangeStrategyEngine:
         - Stage 2: Classify strategies
         - Stage 3 & 4: Check for signals
         
+        Ranges are checked in priority order and the first signal is returned.
+
         Returns:
             TradeSignal if any range generates a signal, None otherwise
         """
+        # Bind loop invariants once
+        candle_processor = self.candle_processor
+        multi_range_state = self.multi_range_state
+        now = datetime.now(timezone.utc)
+
         # Check each range configuration
-        for range_id in self.candle_processor.get_all_range_ids():
+        for range_id in candle_processor.get_all_range_ids():
             # Check if we're in a restricted trading period for this range
-            if self._is_in_restricted_period(range_id):
+            if self._is_in_restricted_period(range_id, now):
                 continue
             
             # Must have a reference candle to trade from
-            if not self.candle_processor.has_reference_candle(range_id):
-                self.logger.debug(f"No reference candle available yet for {range_id}", self.symbol)
-                continue
-            
-            # Get current reference candle
-            candle_ref = self.candle_processor.get_current_reference_candle(range_id)
+            candle_ref = candle_processor.get_current_reference_candle(range_id)
             if candle_ref is None:
+                if self.logger.isEnabledFor(logging.DEBUG, self.symbol):
+                    self.logger.debug(f"No reference candle available yet for {range_id}", self.symbol)
                 continue
             
             # Get latest breakout candle
-            candle_breakout = self.candle_processor.get_latest_breakout_candle(range_id)
+            candle_breakout = candle_processor.get_latest_breakout_candle(range_id)
             if candle_breakout is None:
                 continue
             
             # Get or create state for this range
-            state = self.multi_range_state.get_or_create_state(range_id)
+            state = multi_range_state.get_or_create_state(range_id)
             
             # === STAGE 1: UNIFIED BREAKOUT DETECTION ===
             self._detect_breakout(range_id, state, candle_ref, candle_breakout)
+
+            # Nothing to classify or confirm until a breakout is live
+            if not state.has_active_breakout():
+                continue
+            
+            # Breakout history shared by the volume and divergence checks below
+            df = candle_processor.get_breakout_candles(range_id, count=100)
             
             # === STAGE 2: STRATEGY CLASSIFICATION ===
-            self._classify_strategies(range_id, state, candle_breakout)
+            self._classify_strategies(range_id, state, candle_breakout, df)
             
             # === STAGE 3 & 4: CHECK FOR SIGNALS ===
-            signal = self._check_all_strategies(range_id, state, candle_ref, candle_breakout)
-            if signal:
-                return signal
+            if state.any_strategy_qualified():
+                signal = self._check_all_strategies(range_id, state, candle_ref, candle_breakout, df)
+                if signal:
+                    return signal
             
             # === CLEANUP: Reset if both strategies rejected ===
             if state.both_strategies_rejected():
@@ -115,7 +326,7 @@ class MultiRangeStrategyEngine:
         
         return None
     
-    def _is_in_restricted_period(self, range_id: str) -> bool:
+    def _is_in_restricted_period(self, range_id: str, now: Optional[datetime] = None) -> bool:
         """
         Check if we're in a restricted trading period for a specific range.
         
@@ -124,69 +335,35 @@ class MultiRangeStrategyEngine:
         
         Args:
             range_id: Range configuration identifier
+            now: Current UTC time (optional, read from the clock if not supplied)
             
         Returns:
             True if in restricted period
         """
-        # Get range configuration
-        config = self.candle_processor.range_configs.get(range_id)
-        if not config or not config.use_specific_time or not config.reference_time:
-            return False
-        
-        current_time = datetime.now(timezone.utc)
-        
-        # Calculate reference candle duration based on timeframe
-        # H4 = 4 hours, M15 = 15 minutes, etc.
-        timeframe = config.reference_timeframe
-        if timeframe.startswith('H'):
-            hours = int(timeframe[1:])
-            duration_hours = hours
-        elif timeframe.startswith('M'):
-            minutes = int(timeframe[1:])
-            duration_hours = minutes / 60.0
-        else:
-            # Unknown timeframe, no restriction
-            return False
-        
-        # Calculate start and end times in minutes since midnight for easier comparison
-        ref_start_minutes = config.reference_time.hour * 60 + config.reference_time.minute
-
-        # Calculate duration in minutes
-        if timeframe.startswith('H'):
-            hours = int(timeframe[1:])
-            duration_minutes = hours * 60
-        elif timeframe.startswith('M'):
-            duration_minutes = int(timeframe[1:])
-        else:
+        window = self._restricted_windows.get(range_id)
+        if window is None:
             return False
 
-        ref_end_minutes = ref_start_minutes + duration_minutes
-
         # Current time in minutes since midnight
-        current_minutes = current_time.hour * 60 + current_time.minute
+        if now is None:
+            now = datetime.now(timezone.utc)
+        current_minutes = now.hour * 60 + now.minute
 
         # Check if current time is within the reference candle formation period
-        # Handle day wrap-around
-        if ref_end_minutes >= 1440:  # 24 hours = 1440 minutes
-            # Candle crosses midnight
-            in_period = (current_minutes >= ref_start_minutes) or (current_minutes < (ref_end_minutes - 1440))
-        else:
-            # Normal case - same day
-            in_period = (current_minutes >= ref_start_minutes) and (current_minutes < ref_end_minutes)
-
-        if in_period:
-            end_hour = (ref_start_minutes + duration_minutes) // 60
-            end_minute = (ref_start_minutes + duration_minutes) % 60
-            if end_hour >= 24:
-                end_hour -= 24
+        if not window.bitmap[current_minutes >> 3] & (1 << (current_minutes & 7)):
+            return False
+
+        if self.logger.isEnabledFor(logging.DEBUG, self.symbol):
+            start_hour, start_minute = divmod(window.start_minutes, 60)
+            end_hour, end_minute = divmod(window.end_minutes, 60)
             self.logger.debug(
                 f"Trading suspended for {range_id} - Reference candle forming "
-                f"({config.reference_time.hour:02d}:{config.reference_time.minute:02d} - "
+                f"({start_hour:02d}:{start_minute:02d} - "
                 f"{end_hour:02d}:{end_minute:02d} UTC)",
                 self.symbol
             )
 
-        return in_period
+        return True
     
     def _detect_breakout(self, range_id: str, state: UnifiedBreakoutState, 
                         candle_ref: ReferenceCandle, candle_breakout: CandleData):
@@ -202,58 +379,47 @@ class MultiRangeStrategyEngine:
         # Check for timeout on existing breakouts FIRST
         self._check_breakout_timeout(range_id, state, candle_breakout)
         
-        # Check for breakout ABOVE reference high
-        if not state.breakout_above_detected:
-            # Validate: Open INSIDE range AND Close ABOVE high
-            open_inside_range = candle_breakout.open >= candle_ref.low and candle_breakout.open <= candle_ref.high
-            close_above_high = candle_breakout.close > candle_ref.high
+        # A breakout candle must open INSIDE the reference range
+        if not candle_ref.low <= candle_breakout.open <= candle_ref.high:
+            return
+        close = candle_breakout.close
+        
+        # Check for breakout ABOVE reference high (Close ABOVE high)
+        if not state.breakout_above_detected and close > candle_ref.high:
+            state.mark_breakout_above(candle_breakout.time, candle_breakout.volume)
             
-            if open_inside_range and close_above_high:
-                state.breakout_above_detected = True
-                state.breakout_above_volume = candle_breakout.volume
-                state.breakout_above_time = candle_breakout.time
-                
-                self.logger.info("=" * 60, self.symbol)
-                self.logger.info(f">>> BREAKOUT ABOVE HIGH DETECTED [{range_id}] <<<", self.symbol)
-                self.logger.info(f"Breakout Open: {candle_breakout.open:.5f} (inside range ✓)", self.symbol)
-                self.logger.info(f"Breakout Close: {candle_breakout.close:.5f} (above high ✓)", self.symbol)
-                self.logger.info(f"Reference High: {candle_ref.high:.5f}", self.symbol)
-                self.logger.info(f"Reference Low: {candle_ref.low:.5f}", self.symbol)
-                self.logger.info(f"Reference Time: {candle_ref.time}", self.symbol)
-                self.logger.info(f"Breakout Time: {candle_breakout.time}", self.symbol)
-                self.logger.info(f"Breakout Volume: {candle_breakout.volume}", self.symbol)
-                self.logger.info(f"Timeout at: {candle_breakout.time + timedelta(minutes=self.symbol_params.breakout_timeout_candles * 5)}", self.symbol)
-                self.logger.info("=" * 60, self.symbol)
+            self._log_breakout_banner("ABOVE HIGH", "above high", range_id, candle_ref, candle_breakout)
         
-        # Check for breakout BELOW reference low
-        if not state.breakout_below_detected:
-            # Validate: Open INSIDE range AND Close BELOW low
-            open_inside_range = candle_breakout.open >= candle_ref.low and candle_breakout.open <= candle_ref.high
-            close_below_low = candle_breakout.close < candle_ref.low
+        # Check for breakout BELOW reference low (Close BELOW low)
+        if not state.breakout_below_detected and close < candle_ref.low:
+            state.mark_breakout_below(candle_breakout.time, candle_breakout.volume)
             
-            if open_inside_range and close_below_low:
-                state.breakout_below_detected = True
-                state.breakout_below_volume = candle_breakout.volume
-                state.breakout_below_time = candle_breakout.time
-                
-                self.logger.info("=" * 60, self.symbol)
-                self.logger.info(f">>> BREAKOUT BELOW LOW DETECTED [{range_id}] <<<", self.symbol)
-                self.logger.info(f"Breakout Open: {candle_breakout.open:.5f} (inside range ✓)", self.symbol)
-                self.logger.info(f"Breakout Close: {candle_breakout.close:.5f} (below low ✓)", self.symbol)
-                self.logger.info(f"Reference High: {candle_ref.high:.5f}", self.symbol)
-                self.logger.info(f"Reference Low: {candle_ref.low:.5f}", self.symbol)
-                self.logger.info(f"Reference Time: {candle_ref.time}", self.symbol)
-                self.logger.info(f"Breakout Time: {candle_breakout.time}", self.symbol)
-                self.logger.info(f"Breakout Volume: {candle_breakout.volume}", self.symbol)
-                # Calculate timeout using TimeframeConverter
-                config = self.candle_processor.range_configs.get(range_id)
-                if config:
-                    minutes_per_candle = TimeframeConverter.get_minutes_per_candle(config.breakout_timeframe)
-                    timeout_minutes = self.symbol_params.breakout_timeout_candles * minutes_per_candle
-                    self.logger.info(f"Timeout at: {candle_breakout.time + timedelta(minutes=timeout_minutes)}", self.symbol)
-                else:
-                    self.logger.info(f"Timeout at: {candle_breakout.time + timedelta(minutes=self.symbol_params.breakout_timeout_candles * 5)}", self.symbol)
-                self.logger.info("=" * 60, self.symbol)
+            self._log_breakout_banner("BELOW LOW", "below low", range_id, candle_ref, candle_breakout)
+
+    def _log_breakout_banner(self, side: str, close_status: str, range_id: str,
+                             candle_ref: ReferenceCandle, candle_breakout: CandleData):
+        """
+        Log the breakout detection banner as a single multi-line message.
+
+        Args:
+            side: Breakout side for the title (e.g., "ABOVE HIGH")
+            close_status: Close position description (e.g., "above high")
+            range_id: Range configuration identifier
+            candle_ref: Reference candle
+            candle_breakout: Breakout candle
+        """
+        if not self.logger.isEnabledFor(logging.INFO, self.symbol):
+            return
+        timeout_delta = self._timeout_deltas.get(range_id)
+        if timeout_delta is None:
+            timeout_delta = timedelta(minutes=self.symbol_params.breakout_timeout_candles * 5)
+        self.logger.info_lazy(
+            self._BREAKOUT_BANNER_FMT,
+            self._SEP, side, range_id, candle_breakout.open, candle_breakout.close, close_status,
+            candle_ref.high, candle_ref.low, candle_ref.time, candle_breakout.time,
+            candle_breakout.volume, candle_breakout.time + timeout_delta, self._SEP,
+            symbol=self.symbol
+        )
     
     def _check_breakout_timeout(self, range_id: str, state: UnifiedBreakoutState, candle_breakout: CandleData):
         """
@@ -264,59 +430,60 @@ class MultiRangeStrategyEngine:
             state: Breakout state for this range
             candle_breakout: Current breakout candle with timestamp
         """
-        # Get breakout timeframe to calculate timeout
-        config = self.candle_processor.range_configs.get(range_id)
-        if not config:
+        # Nothing can time out until a breakout is detected
+        if not state.has_active_breakout():
             return
 
-        # Calculate timeout using TimeframeConverter
-        minutes_per_candle = TimeframeConverter.get_minutes_per_candle(config.breakout_timeframe)
-        timeout_minutes = self.symbol_params.breakout_timeout_candles * minutes_per_candle
-        timeout_delta = timedelta(minutes=timeout_minutes)
+        # Timeout precomputed from the breakout timeframe
+        timeout_seconds = self._timeout_seconds.get(range_id)
+        if timeout_seconds is None:
+            return
+        timeout_minutes = self._timeout_minutes[range_id]
+        # Ages are compared as plain seconds against the stored breakout timestamps
+        current_ts = candle_breakout.time.timestamp()
         
         # Check breakout ABOVE timeout
         if state.breakout_above_detected and state.breakout_above_time:
-            age = candle_breakout.time - state.breakout_above_time
-            age_minutes = int(age.total_seconds() / 60)
+            age_seconds = current_ts - state.breakout_above_time_ts
+            age_minutes = int(age_seconds / 60)
             
-            self.logger.info(f"[TIMEOUT CHECK ABOVE {range_id}] Age={age_minutes}min, Limit={timeout_minutes}min", self.symbol)
+            self.logger.info_lazy("[TIMEOUT CHECK ABOVE %s] Age=%dmin, Limit=%dmin",
+                                  range_id, age_minutes, timeout_minutes, symbol=self.symbol)
             
-            if age.total_seconds() < 0:
-                self.logger.warning(f"Negative breakout age detected: {age.total_seconds()}s - possible timezone issue", self.symbol)
+            if age_seconds < 0:
+                self.logger.warning(f"Negative breakout age detected: {age_seconds}s - possible timezone issue", self.symbol)
                 return
             
-            if age > timeout_delta:
-                self.logger.info("=" * 60, self.symbol)
-                self.logger.info(f">>> BREAKOUT ABOVE TIMEOUT [{range_id}] - Resetting <<<", self.symbol)
-                self.logger.info(f"Breakout Age: {age_minutes} minutes", self.symbol)
-                self.logger.info(f"Timeout Limit: {timeout_minutes} minutes", self.symbol)
-                self.logger.info("=" * 60, self.symbol)
+            if age_seconds > timeout_seconds:
+                self.logger.info_lazy(self._TIMEOUT_BANNER_FMT, self._SEP, "ABOVE", range_id,
+                                      age_minutes, timeout_minutes, self._SEP, symbol=self.symbol)
                 state.reset_breakout_above()
             else:
-                self.logger.info(f"[TIMEOUT CHECK ABOVE {range_id}] Breakout still valid ({age_minutes}/{timeout_minutes} min)", self.symbol)
+                self.logger.info_lazy("[TIMEOUT CHECK ABOVE %s] Breakout still valid (%d/%d min)",
+                                      range_id, age_minutes, timeout_minutes, symbol=self.symbol)
         
         # Check breakout BELOW timeout
         if state.breakout_below_detected and state.breakout_below_time:
-            age = candle_breakout.time - state.breakout_below_time
-            age_minutes = int(age.total_seconds() / 60)
+            age_seconds = current_ts - state.breakout_below_time_ts
+            age_minutes = int(age_seconds / 60)
             
-            self.logger.info(f"[TIMEOUT CHECK BELOW {range_id}] Age={age_minutes}min, Limit={timeout_minutes}min", self.symbol)
+            self.logger.info_lazy("[TIMEOUT CHECK BELOW %s] Age=%dmin, Limit=%dmin",
+                                  range_id, age_minutes, timeout_minutes, symbol=self.symbol)
             
-            if age.total_seconds() < 0:
-                self.logger.warning(f"Negative breakout age detected: {age.total_seconds()}s - possible timezone issue", self.symbol)
+            if age_seconds < 0:
+                self.logger.warning(f"Negative breakout age detected: {age_seconds}s - possible timezone issue", self.symbol)
                 return
             
-            if age > timeout_delta:
-                self.logger.info("=" * 60, self.symbol)
-                self.logger.info(f">>> BREAKOUT BELOW TIMEOUT [{range_id}] - Resetting <<<", self.symbol)
-                self.logger.info(f"Breakout Age: {age_minutes} minutes", self.symbol)
-                self.logger.info(f"Timeout Limit: {timeout_minutes} minutes", self.symbol)
-                self.logger.info("=" * 60, self.symbol)
+            if age_seconds > timeout_seconds:
+                self.logger.info_lazy(self._TIMEOUT_BANNER_FMT, self._SEP, "BELOW", range_id,
+                                      age_minutes, timeout_minutes, self._SEP, symbol=self.symbol)
                 state.reset_breakout_below()
             else:
-                self.logger.info(f"[TIMEOUT CHECK BELOW {range_id}] Breakout still valid ({age_minutes}/{timeout_minutes} min)", self.symbol)
+                self.logger.info_lazy("[TIMEOUT CHECK BELOW %s] Breakout still valid (%d/%d min)",
+                                      range_id, age_minutes, timeout_minutes, symbol=self.symbol)
 
-    def _classify_strategies(self, range_id: str, state: UnifiedBreakoutState, candle_breakout: CandleData):
+    def _classify_strategies(self, range_id: str, state: UnifiedBreakoutState, candle_breakout: CandleData,
+                             df: Optional[pd.DataFrame] = None):
         """
         STAGE 2: Strategy classification for a specific range.
 
@@ -324,98 +491,81 @@ class MultiRangeStrategyEngine:
             range_id: Range configuration identifier
             state: Breakout state for this range
             candle_breakout: Current breakout candle
+            df: Breakout candle history (optional, fetched if not supplied)
         """
-        # Get breakout candles for average volume calculation
-        df = self.candle_processor.get_breakout_candles(range_id, count=100)
-        if df is None:
+        classify_above = (state.breakout_above_detected and
+                          not state.true_buy_qualified and not state.false_sell_qualified)
+        classify_below = (state.breakout_below_detected and
+                          not state.true_sell_qualified and not state.false_buy_qualified)
+        if not (classify_above or classify_below):
             return
 
-        # Calculate average volume
-        avg_volume = self.indicators.calculate_average_volume(
-            df['tick_volume'],
-            self.symbol_params.volume_average_period
-        )
+        # Average volume over the breakout timeframe
+        avg_volume = self._get_avg_volume(range_id, candle_breakout, df)
+        if avg_volume is None:
+            return
 
         # === CLASSIFY BREAKOUT ABOVE (TRUE BUY / FALSE SELL) ===
-        if state.breakout_above_detected and not state.true_buy_qualified and not state.false_sell_qualified:
-            volume = state.breakout_above_volume
-
-            # Check if qualifies for TRUE BUY (high volume continuation)
-            if self.symbol_params.enable_true_breakout_strategy:
-                is_high_volume = self.indicators.is_true_breakout_volume_high(
-                    volume, avg_volume,
-                    self.symbol_params.true_breakout_volume_min,
-                    self.symbol
-                )
-
-                state.true_buy_qualified = True
-                state.true_buy_volume_ok = is_high_volume
-
-                vol_status = "✓" if is_high_volume else "✗"
-                self.logger.info(f">>> TRUE BUY QUALIFIED [{range_id}] (High Vol {vol_status}) <<<", self.symbol)
-                self.logger.info("Waiting for continuation above reference high...", self.symbol)
-
-            # Check if qualifies for FALSE SELL (low volume reversal)
-            if self.symbol_params.enable_false_breakout_strategy:
-                is_low_volume = self.indicators.is_breakout_volume_low(
-                    volume, avg_volume,
-                    self.symbol_params.breakout_volume_max,
-                    self.symbol
-                )
+        if classify_above:
+            self._classify_side(range_id, state, _ABOVE_SIDE, state.breakout_above_volume, avg_volume, df)
 
-                # Check divergence (tracked but not required)
-                divergence_ok = self._check_sell_divergence(range_id)
-
-                state.false_sell_qualified = True
-                state.false_sell_volume_ok = is_low_volume
-                state.false_sell_divergence_ok = divergence_ok
+        # === CLASSIFY BREAKOUT BELOW (TRUE SELL / FALSE BUY) ===
+        if classify_below:
+            self._classify_side(range_id, state, _BELOW_SIDE, state.breakout_below_volume, avg_volume, df)
 
-                vol_status = "✓" if is_low_volume else "✗"
-                div_status = "✓" if divergence_ok else "✗"
-                self.logger.info(f">>> FALSE SELL QUALIFIED [{range_id}] (Low Vol {vol_status}, Div {div_status}) <<<", self.symbol)
-                self.logger.info("Waiting for reversal back below reference high...", self.symbol)
+    def _classify_side(self, range_id: str, state: UnifiedBreakoutState, side: ClassificationSide,
+                       volume: int, avg_volume: float, df: Optional[pd.DataFrame] = None):
+        """
+        Classify one breakout side into its TRUE and FALSE strategies.
 
-        # === CLASSIFY BREAKOUT BELOW (TRUE SELL / FALSE BUY) ===
-        if state.breakout_below_detected and not state.true_sell_qualified and not state.false_buy_qualified:
-            volume = state.breakout_below_volume
-
-            # Check if qualifies for TRUE SELL (high volume continuation)
-            if self.symbol_params.enable_true_breakout_strategy:
-                is_high_volume = self.indicators.is_true_breakout_volume_high(
-                    volume, avg_volume,
-                    self.symbol_params.true_breakout_volume_min,
-                    self.symbol
-                )
+        Args:
+            range_id: Range configuration identifier
+            state: Breakout state for this range
+            side: Strategy setters and messages for the breakout side
+            volume: Breakout candle volume
+            avg_volume: Average volume over the breakout timeframe
+            df: Breakout candle history (optional, fetched if not supplied)
+        """
+        params = self.symbol_params
+        true_enabled = params.enable_true_breakout_strategy
+        false_enabled = params.enable_false_breakout_strategy
+        if not (true_enabled or false_enabled):
+            return
 
-                state.true_sell_qualified = True
-                state.true_sell_volume_ok = is_high_volume
+        # One volume check covers both strategies: TRUE wants HIGH volume, FALSE wants LOW volume
+        is_high_volume, is_low_volume = self.indicators.check_breakout_volume(
+            volume, avg_volume,
+            params.true_breakout_volume_min if true_enabled else None,
+            params.breakout_volume_max if false_enabled else None,
+            self.symbol
+        )
 
-                vol_status = "✓" if is_high_volume else "✗"
-                self.logger.info(f">>> TRUE SELL QUALIFIED [{range_id}] (High Vol {vol_status}) <<<", self.symbol)
-                self.logger.info("Waiting for continuation below reference low...", self.symbol)
+        # Check if qualifies for TRUE breakout (high volume continuation)
+        if true_enabled:
+            side.qualify_true(state, is_high_volume)
 
-            # Check if qualifies for FALSE BUY (low volume reversal)
-            if self.symbol_params.enable_false_breakout_strategy:
-                is_low_volume = self.indicators.is_breakout_volume_low(
-                    volume, avg_volume,
-                    self.symbol_params.breakout_volume_max,
-                    self.symbol
-                )
+            vol_status = "✓" if is_high_volume else "✗"
+            self.logger.info(f">>> {side.true_label} QUALIFIED [{range_id}] (High Vol {vol_status}) <<<", self.symbol)
+            self.logger.info(side.true_waiting_message, self.symbol)
 
-                # Check divergence (tracked but not required)
-                divergence_ok = self._check_buy_divergence(range_id)
+        # Check if qualifies for FALSE breakout (low volume reversal)
+        if false_enabled:
+            # Check divergence (tracked but not required)
+            if side.bullish_divergence:
+                divergence_ok = self._check_buy_divergence(range_id, df)
+            else:
+                divergence_ok = self._check_sell_divergence(range_id, df)
 
-                state.false_buy_qualified = True
-                state.false_buy_volume_ok = is_low_volume
-                state.false_buy_divergence_ok = divergence_ok
+            side.qualify_false(state, is_low_volume, divergence_ok)
 
-                vol_status = "✓" if is_low_volume else "✗"
-                div_status = "✓" if divergence_ok else "✗"
-                self.logger.info(f">>> FALSE BUY QUALIFIED [{range_id}] (Low Vol {vol_status}, Div {div_status}) <<<", self.symbol)
-                self.logger.info("Waiting for reversal back above reference low...", self.symbol)
+            vol_status = "✓" if is_low_volume else "✗"
+            div_status = "✓" if divergence_ok else "✗"
+            self.logger.info(f">>> {side.false_label} QUALIFIED [{range_id}] (Low Vol {vol_status}, Div {div_status}) <<<", self.symbol)
+            self.logger.info(side.false_waiting_message, self.symbol)
 
     def _check_all_strategies(self, range_id: str, state: UnifiedBreakoutState,
-                             candle_ref: ReferenceCandle, candle_breakout: CandleData) -> Optional[TradeSignal]:
+                             candle_ref: ReferenceCandle, candle_breakout: CandleData,
+                             df: Optional[pd.DataFrame] = None) -> Optional[TradeSignal]:
         """
         STAGE 3 & 4: Check all qualified strategies for signals.
 
@@ -424,6 +574,7 @@ class MultiRangeStrategyEngine:
             state: Breakout state for this range
             candle_ref: Reference candle
             candle_breakout: Current breakout candle
+            df: Breakout candle history (optional, fetched if not supplied)
 
         Returns:
             TradeSignal if signal generated, None otherwise
@@ -435,15 +586,15 @@ class MultiRangeStrategyEngine:
                 state.false_buy_reversal_volume = candle_breakout.volume
 
                 # Check reversal volume (tracked but not required)
-                reversal_volume_ok = self._check_unified_reversal_volume(range_id, candle_breakout.volume)
+                reversal_volume_ok = self._check_unified_reversal_volume(range_id, candle_breakout, df)
                 state.false_buy_reversal_volume_ok = reversal_volume_ok
 
-                vol_status = "✓" if reversal_volume_ok else "✗"
-                self.logger.info(f">>> FALSE BUY REVERSAL DETECTED [{range_id}] (Rev Vol {vol_status}) <<<", self.symbol)
-                self.logger.info(f"Breakout Close: {candle_breakout.close:.5f}", self.symbol)
-                self.logger.info(f"Reference Low: {candle_ref.low:.5f}", self.symbol)
-                self.logger.info(f"Reversal Volume: {candle_breakout.volume}", self.symbol)
-                self.logger.info(f"Waiting for next candle to confirm reversal direction...", self.symbol)
+                self.logger.info_lazy(
+                    self._REVERSAL_DETECTED_FMT,
+                    "FALSE BUY", range_id, "✓" if reversal_volume_ok else "✗",
+                    candle_breakout.close, "Reference Low", candle_ref.low, candle_breakout.volume,
+                    symbol=self.symbol
+                )
 
         # === FALSE BUY: Check for confirmation candle after reversal ===
         elif state.false_buy_reversal_detected and not state.false_buy_reversal_confirmed:
@@ -451,15 +602,17 @@ class MultiRangeStrategyEngine:
             if candle_breakout.close > candle_ref.low:
                 state.false_buy_reversal_confirmed = True
 
-                self.logger.info(f">>> FALSE BUY REVERSAL CONFIRMED [{range_id}] <<<", self.symbol)
-                self.logger.info(f"Confirmation Close: {candle_breakout.close:.5f}", self.symbol)
-                self.logger.info(f"Reference Low: {candle_ref.low:.5f}", self.symbol)
-                self.logger.info(f"*** FALSE BUY SIGNAL GENERATED [{range_id}] ***", self.symbol)
-                return self._generate_buy_signal(range_id, candle_ref, candle_breakout, is_true_breakout=False)
+                self.logger.info_lazy(
+                    self._REVERSAL_CONFIRMED_FMT,
+                    "FALSE BUY", range_id, candle_breakout.close, "Reference Low", candle_ref.low, "FALSE BUY", range_id,
+                    symbol=self.symbol
+                )
+                return self._generate_buy_signal(range_id, candle_ref, candle_breakout,
+                                                 is_true_breakout=False, df=df, state=state)
             else:
                 # Reversal failed - price went back below reference low
-                self.logger.info(f">>> FALSE BUY REVERSAL FAILED [{range_id}] - Price back below reference low <<<", self.symbol)
-                self.logger.info(f"Resetting false buy state...", self.symbol)
+                self.logger.info_lazy(self._REVERSAL_FAILED_FMT, "FALSE BUY", range_id, "below reference low", "false buy",
+                                      symbol=self.symbol)
                 state.false_buy_qualified = False
                 state.false_buy_reversal_detected = False
                 state.false_buy_reversal_volume = 0
@@ -473,15 +626,15 @@ class MultiRangeStrategyEngine:
                 state.false_sell_reversal_volume = candle_breakout.volume
 
                 # Check reversal volume (tracked but not required)
-                reversal_volume_ok = self._check_unified_reversal_volume(range_id, candle_breakout.volume)
+                reversal_volume_ok = self._check_unified_reversal_volume(range_id, candle_breakout, df)
                 state.false_sell_reversal_volume_ok = reversal_volume_ok
 
-                vol_status = "✓" if reversal_volume_ok else "✗"
-                self.logger.info(f">>> FALSE SELL REVERSAL DETECTED [{range_id}] (Rev Vol {vol_status}) <<<", self.symbol)
-                self.logger.info(f"Breakout Close: {candle_breakout.close:.5f}", self.symbol)
-                self.logger.info(f"Reference High: {candle_ref.high:.5f}", self.symbol)
-                self.logger.info(f"Reversal Volume: {candle_breakout.volume}", self.symbol)
-                self.logger.info(f"Waiting for next candle to confirm reversal direction...", self.symbol)
+                self.logger.info_lazy(
+                    self._REVERSAL_DETECTED_FMT,
+                    "FALSE SELL", range_id, "✓" if reversal_volume_ok else "✗",
+                    candle_breakout.close, "Reference High", candle_ref.high, candle_breakout.volume,
+                    symbol=self.symbol
+                )
 
         # === FALSE SELL: Check for confirmation candle after reversal ===
         elif state.false_sell_reversal_detected and not state.false_sell_reversal_confirmed:
@@ -489,15 +642,17 @@ class MultiRangeStrategyEngine:
             if candle_breakout.close < candle_ref.high:
                 state.false_sell_reversal_confirmed = True
 
-                self.logger.info(f">>> FALSE SELL REVERSAL CONFIRMED [{range_id}] <<<", self.symbol)
-                self.logger.info(f"Confirmation Close: {candle_breakout.close:.5f}", self.symbol)
-                self.logger.info(f"Reference High: {candle_ref.high:.5f}", self.symbol)
-                self.logger.info(f"*** FALSE SELL SIGNAL GENERATED [{range_id}] ***", self.symbol)
-                return self._generate_sell_signal(range_id, candle_ref, candle_breakout, is_true_breakout=False)
+                self.logger.info_lazy(
+                    self._REVERSAL_CONFIRMED_FMT,
+                    "FALSE SELL", range_id, candle_breakout.close, "Reference High", candle_ref.high, "FALSE SELL", range_id,
+                    symbol=self.symbol
+                )
+                return self._generate_sell_signal(range_id, candle_ref, candle_breakout,
+                                                  is_true_breakout=False, df=df, state=state)
             else:
                 # Reversal failed - price went back above reference high
-                self.logger.info(f">>> FALSE SELL REVERSAL FAILED [{range_id}] - Price back above reference high <<<", self.symbol)
-                self.logger.info(f"Resetting false sell state...", self.symbol)
+                self.logger.info_lazy(self._REVERSAL_FAILED_FMT, "FALSE SELL", range_id, "above reference high", "false sell",
+                                      symbol=self.symbol)
                 state.false_sell_qualified = False
                 state.false_sell_reversal_detected = False
                 state.false_sell_reversal_volume = 0
@@ -508,14 +663,15 @@ class MultiRangeStrategyEngine:
         if state.true_buy_qualified:
             # First check for retest (pullback to reference high)
             if not state.true_buy_retest_detected:
-                retest_range = candle_ref.high * RETEST_RANGE_PERCENT
+                retest_range = candle_ref.retest_tol_high
                 if abs(candle_breakout.close - candle_ref.high) <= retest_range:
                     state.true_buy_retest_detected = True
                     state.true_buy_retest_ok = True
-                    self.logger.info(f">>> TRUE BUY RETEST DETECTED [{range_id}] <<<", self.symbol)
-                    self.logger.info(f"Breakout Close: {candle_breakout.close:.5f}", self.symbol)
-                    self.logger.info(f"Reference High: {candle_ref.high:.5f}", self.symbol)
-                    self.logger.info(f"Retest Range: {retest_range:.5f}", self.symbol)
+                    self.logger.info_lazy(
+                        self._RETEST_DETECTED_FMT,
+                        "TRUE BUY", range_id, candle_breakout.close, "Reference High", candle_ref.high, retest_range,
+                        symbol=self.symbol
+                    )
 
             # Then check for continuation above reference high
             if not state.true_buy_continuation_detected:
@@ -524,30 +680,32 @@ class MultiRangeStrategyEngine:
                     state.true_buy_continuation_volume = candle_breakout.volume
 
                     # Check continuation volume (tracked but not required)
-                    continuation_volume_ok = self._check_unified_continuation_volume(range_id, candle_breakout.volume)
+                    continuation_volume_ok = self._check_unified_continuation_volume(range_id, candle_breakout, df)
                     state.true_buy_continuation_volume_ok = continuation_volume_ok
 
-                    vol_status = "✓" if continuation_volume_ok else "✗"
-                    self.logger.info(f">>> TRUE BUY CONTINUATION DETECTED [{range_id}] (Cont Vol {vol_status}) <<<", self.symbol)
-                    self.logger.info(f"Breakout Close: {candle_breakout.close:.5f}", self.symbol)
-                    self.logger.info(f"Reference High: {candle_ref.high:.5f}", self.symbol)
-                    self.logger.info(f"Continuation Volume: {candle_breakout.volume}", self.symbol)
-
-                    self.logger.info(f"*** TRUE BUY SIGNAL GENERATED [{range_id}] ***", self.symbol)
-                    return self._generate_buy_signal(range_id, candle_ref, candle_breakout, is_true_breakout=True)
+                    self.logger.info_lazy(
+                        self._CONTINUATION_DETECTED_FMT,
+                        "TRUE BUY", range_id, "✓" if continuation_volume_ok else "✗",
+                        candle_breakout.close, "Reference High", candle_ref.high, candle_breakout.volume,
+                        "TRUE BUY", range_id,
+                        symbol=self.symbol
+                    )
+                    return self._generate_buy_signal(range_id, candle_ref, candle_breakout,
+                                                     is_true_breakout=True, df=df, state=state)
 
         # === TRUE SELL: Check for retest and continuation ===
         if state.true_sell_qualified:
             # First check for retest (pullback to reference low)
             if not state.true_sell_retest_detected:
-                retest_range = candle_ref.low * RETEST_RANGE_PERCENT
+                retest_range = candle_ref.retest_tol_low
                 if abs(candle_breakout.close - candle_ref.low) <= retest_range:
                     state.true_sell_retest_detected = True
                     state.true_sell_retest_ok = True
-                    self.logger.info(f">>> TRUE SELL RETEST DETECTED [{range_id}] <<<", self.symbol)
-                    self.logger.info(f"Breakout Close: {candle_breakout.close:.5f}", self.symbol)
-                    self.logger.info(f"Reference Low: {candle_ref.low:.5f}", self.symbol)
-                    self.logger.info(f"Retest Range: {retest_range:.5f}", self.symbol)
+                    self.logger.info_lazy(
+                        self._RETEST_DETECTED_FMT,
+                        "TRUE SELL", range_id, candle_breakout.close, "Reference Low", candle_ref.low, retest_range,
+                        symbol=self.symbol
+                    )
 
             # Then check for continuation below reference low
             if not state.true_sell_continuation_detected:
@@ -556,57 +714,86 @@ class MultiRangeStrategyEngine:
                     state.true_sell_continuation_volume = candle_breakout.volume
 
                     # Check continuation volume (tracked but not required)
-                    continuation_volume_ok = self._check_unified_continuation_volume(range_id, candle_breakout.volume)
+                    continuation_volume_ok = self._check_unified_continuation_volume(range_id, candle_breakout, df)
                     state.true_sell_continuation_volume_ok = continuation_volume_ok
 
-                    vol_status = "✓" if continuation_volume_ok else "✗"
-                    self.logger.info(f">>> TRUE SELL CONTINUATION DETECTED [{range_id}] (Cont Vol {vol_status}) <<<", self.symbol)
-                    self.logger.info(f"Breakout Close: {candle_breakout.close:.5f}", self.symbol)
-                    self.logger.info(f"Reference Low: {candle_ref.low:.5f}", self.symbol)
-                    self.logger.info(f"Continuation Volume: {candle_breakout.volume}", self.symbol)
-
-                    self.logger.info(f"*** TRUE SELL SIGNAL GENERATED [{range_id}] ***", self.symbol)
-                    return self._generate_sell_signal(range_id, candle_ref, candle_breakout, is_true_breakout=True)
+                    self.logger.info_lazy(
+                        self._CONTINUATION_DETECTED_FMT,
+                        "TRUE SELL", range_id, "✓" if continuation_volume_ok else "✗",
+                        candle_breakout.close, "Reference Low", candle_ref.low, candle_breakout.volume,
+                        "TRUE SELL", range_id,
+                        symbol=self.symbol
+                    )
+                    return self._generate_sell_signal(range_id, candle_ref, candle_breakout,
+                                                      is_true_breakout=True, df=df, state=state)
 
         return None
 
-    def _check_unified_reversal_volume(self, range_id: str, reversal_volume: int) -> bool:
-        """Check if reversal volume is high (tracked but not required)."""
-        df = self.candle_processor.get_breakout_candles(range_id, count=100)
-        if df is None:
-            return False
+    def _get_avg_volume(self, range_id: str, candle_breakout: CandleData,
+                        df: Optional[pd.DataFrame] = None) -> Optional[float]:
+        """
+        Get the average breakout volume for a range, cached per breakout candle.
+
+        Classification and the reversal/continuation checks all need the same
+        average for the same candle, so it is computed once and reused until
+        the breakout candle time advances.
 
-        avg_volume = self.indicators.calculate_average_volume(
-            df['tick_volume'],
+        Args:
+            range_id: Range configuration identifier
+            candle_breakout: Current breakout candle
+            df: Breakout candle history (optional, fetched if not supplied)
+
+        Returns:
+            Average volume, or None if no candle data is available
+        """
+        cached = self._avg_vol_cache.get(range_id)
+        if cached is not None and cached[0] == candle_breakout.time:
+            return cached[1]
+
+        if df is not None:
+            volumes = df['tick_volume'].to_numpy()
+        else:
+            volumes = self.candle_processor.get_breakout_volumes(range_id, count=100)
+        if volumes is None:
+            return None
+
+        avg_volume = self.indicators.calculate_average_volume_np(
+            volumes,
             self.symbol_params.volume_average_period
         )
+        self._avg_vol_cache[range_id] = (candle_breakout.time, avg_volume)
+        return avg_volume
+
+    def _check_unified_reversal_volume(self, range_id: str, candle_breakout: CandleData,
+                                       df: Optional[pd.DataFrame] = None) -> bool:
+        """Check if reversal volume is high (tracked but not required)."""
+        avg_volume = self._get_avg_volume(range_id, candle_breakout, df)
+        if avg_volume is None:
+            return False
 
         return self.indicators.is_reversal_volume_high(
-            reversal_volume, avg_volume,
+            candle_breakout.volume, avg_volume,
             self.symbol_params.reversal_volume_min,
             self.symbol
         )
 
-    def _check_unified_continuation_volume(self, range_id: str, continuation_volume: int) -> bool:
+    def _check_unified_continuation_volume(self, range_id: str, candle_breakout: CandleData,
+                                           df: Optional[pd.DataFrame] = None) -> bool:
         """Check if continuation volume is high (tracked but not required)."""
-        df = self.candle_processor.get_breakout_candles(range_id, count=100)
-        if df is None:
+        avg_volume = self._get_avg_volume(range_id, candle_breakout, df)
+        if avg_volume is None:
             return False
 
-        avg_volume = self.indicators.calculate_average_volume(
-            df['tick_volume'],
-            self.symbol_params.volume_average_period
-        )
-
         return self.indicators.is_continuation_volume_high(
-            continuation_volume, avg_volume,
+            candle_breakout.volume, avg_volume,
             self.symbol_params.continuation_volume_min,
             self.symbol
         )
 
-    def _check_buy_divergence(self, range_id: str) -> bool:
+    def _check_buy_divergence(self, range_id: str, df: Optional[pd.DataFrame] = None) -> bool:
         """Check for bullish divergence (tracked but not required)."""
-        df = self.candle_processor.get_breakout_candles(range_id, count=100)
+        if df is None:
+            df = self.candle_processor.get_breakout_candles(range_id, count=100)
         if df is None:
             return False
 
@@ -618,9 +805,10 @@ class MultiRangeStrategyEngine:
             self.symbol
         )
 
-    def _check_sell_divergence(self, range_id: str) -> bool:
+    def _check_sell_divergence(self, range_id: str, df: Optional[pd.DataFrame] = None) -> bool:
         """Check for bearish divergence (tracked but not required)."""
-        df = self.candle_processor.get_breakout_candles(range_id, count=100)
+        if df is None:
+            df = self.candle_processor.get_breakout_candles(range_id, count=100)
         if df is None:
             return False
 
@@ -632,7 +820,8 @@ class MultiRangeStrategyEngine:
             self.symbol
         )
 
-    def _find_lowest_low_in_pattern(self, range_id: str, reference_low: float) -> Optional[float]:
+    def _find_lowest_low_in_pattern(self, range_id: str, reference_low: float,
+                                    df: Optional[pd.DataFrame] = None) -> Optional[float]:
         """
         Find the LOWEST LOW among the last 10 confirmation candles.
         Uses the appropriate timeframe based on range_id:
@@ -642,17 +831,21 @@ class MultiRangeStrategyEngine:
         Args:
             range_id: Range identifier (e.g., "4H_5M", "15M_1M")
             reference_low: The reference candle's low price (for logging only)
+            df: Breakout candles already fetched this check (optional)
 
         Returns:
             Lowest low price, or None if no valid candles found
         """
-        # Get last 10 confirmation candles for this range
-        df = self.candle_processor.get_breakout_candles(range_id, count=10)
+        # Get last 10 confirmation candles for this range (the pattern search
+        # only reads the tail, so a longer frame from this check works as-is)
+        if df is None:
+            df = self.candle_processor.get_breakout_candles(range_id, count=10)
 
         # Delegate to SignalGenerator for pattern detection
         return self.signal_generator.find_lowest_low_in_pattern(df, reference_low)
 
-    def _find_highest_high_in_pattern(self, range_id: str, reference_high: float) -> Optional[float]:
+    def _find_highest_high_in_pattern(self, range_id: str, reference_high: float,
+                                      df: Optional[pd.DataFrame] = None) -> Optional[float]:
         """
         Find the HIGHEST HIGH among the last 10 confirmation candles.
         Uses the appropriate timeframe based on range_id:
@@ -662,30 +855,35 @@ class MultiRangeStrategyEngine:
         Args:
             range_id: Range identifier (e.g., "4H_5M", "15M_1M")
             reference_high: The reference candle's high price (for logging only)
+            df: Breakout candles already fetched this check (optional)
 
         Returns:
             Highest high price, or None if no valid candles found
         """
-        # Get last 10 confirmation candles for this range
-        df = self.candle_processor.get_breakout_candles(range_id, count=10)
+        # Get last 10 confirmation candles for this range (the pattern search
+        # only reads the tail, so a longer frame from this check works as-is)
+        if df is None:
+            df = self.candle_processor.get_breakout_candles(range_id, count=10)
 
         # Delegate to SignalGenerator for pattern detection
         return self.signal_generator.find_highest_high_in_pattern(df, reference_high)
 
-    def _calculate_sl_offset(self, reference_price: float) -> float:
+    def _calculate_sl_offset(self, reference_price: float, symbol_info: Optional[dict] = None) -> float:
         """
         Calculate stop loss offset based on configuration.
         Matches the main StrategyEngine logic.
 
         Args:
             reference_price: The reference price (lowest_low for BUY, highest_high for SELL)
+            symbol_info: Symbol info already fetched by the caller (optional)
 
         Returns:
             Stop loss offset in price units
         """
         if self.strategy_config.use_point_based_sl and self.connector is not None:
             # Point-based calculation (recommended)
-            symbol_info = self.connector.get_symbol_info(self.symbol)
+            if symbol_info is None:
+                symbol_info = self.connector.get_symbol_info(self.symbol)
             if symbol_info is not None:
                 point = symbol_info['point']
                 # Convert points to price offset
@@ -711,160 +909,99 @@ class MultiRangeStrategyEngine:
         return sl_offset
 
     def _generate_buy_signal(self, range_id: str, candle_ref: ReferenceCandle,
-                            candle_breakout: CandleData, is_true_breakout: bool = False) -> TradeSignal:
-        """Generate BUY signal for a specific range.
-
-        Args:
-            range_id: Range identifier
-            candle_ref: Reference candle
-            candle_breakout: Breakout candle
-            is_true_breakout: True if this is a true breakout (continuation), False if false breakout (reversal)
-        """
-        # Find the LOWEST LOW among the last 10 candles that closed BELOW reference low
-        # This matches the main StrategyEngine logic
-        lowest_low = self._find_lowest_low_in_pattern(range_id, candle_ref.low)
-
-        if lowest_low is None:
-            self.logger.warning(f"No valid lowest low found for BUY signal [{range_id}]", self.symbol)
-            lowest_low = candle_ref.low  # Fallback to reference low
-
-        # Entry: Will use current ASK price at execution
-        entry = candle_breakout.close
-
-        # Stop Loss: Below the LOWEST LOW (same logic for both TRUE and FALSE strategies)
-        # Use point-based or percentage-based calculation
-        sl_offset = self._calculate_sl_offset(lowest_low)
-
-        # Add spread to SL to account for bid-ask spread
-        # For BUY: Entry at ASK, SL triggered when BID hits SL
-        # So we need to widen SL by spread amount
-        spread_price = 0.0
-        if self.connector is not None:
-            symbol_info = self.connector.get_symbol_info(self.symbol)
-            if symbol_info is not None:
-                spread_points = self.connector.get_spread(self.symbol)
-                if spread_points is not None:
-                    point = symbol_info['point']
-                    spread_price = spread_points * point
-                    self.logger.debug(
-                        f"Adding spread to BUY SL [{range_id}]: {spread_points:.1f} points = {spread_price:.5f}",
-                        self.symbol
-                    )
-
-        sl = lowest_low - sl_offset - spread_price
-
-        # Take Profit: Based on R:R ratio
-        # Note: TP will be recalculated in order_manager using actual execution price
-        risk = entry - sl
-        tp = entry + (risk * self.strategy_config.risk_reward_ratio)
-
-        # Get state for this range to track confirmations
-        state = self.multi_range_state.get_state(range_id)
-
-        # Determine confirmation status based on strategy type
-        if is_true_breakout:
-            # TRUE BREAKOUT: Volume confirmed = breakout volume HIGH + retest occurred + continuation volume HIGH
-            volume_confirmed = (state.true_buy_volume_ok and
-                              state.true_buy_retest_ok and
-                              state.true_buy_continuation_volume_ok)
-            divergence_confirmed = False  # Not used for true breakouts
-        else:
-            # FALSE BREAKOUT: Volume confirmed = breakout volume LOW + reversal volume HIGH
-            volume_confirmed = (state.false_buy_volume_ok and
-                              state.false_buy_reversal_volume_ok)
-            divergence_confirmed = state.false_buy_divergence_ok
-
-        return TradeSignal(
-            symbol=self.symbol,
-            signal_type=PositionType.BUY,
-            entry_price=entry,
-            stop_loss=sl,
-            take_profit=tp,
-            lot_size=0.0,  # Will be calculated by risk manager
-            timestamp=candle_breakout.time,
-            range_id=range_id,
-            reason=f"{'True' if is_true_breakout else 'False'} breakout strategy - Range: {range_id}",
-            max_spread_percent=self.symbol_params.max_spread_percent,
-            is_true_breakout=is_true_breakout,
-            volume_confirmed=volume_confirmed,
-            divergence_confirmed=divergence_confirmed
-        )
+                            candle_breakout: CandleData, is_true_breakout: bool = False,
+                            df: Optional[pd.DataFrame] = None,
+                            state: Optional[UnifiedBreakoutState] = None) -> TradeSignal:
+        """Generate BUY signal for a specific range (see _generate_signal)."""
+        return self._generate_signal(_BUY_SIGNAL, range_id, candle_ref, candle_breakout,
+                                     is_true_breakout, df, state)
 
     def _generate_sell_signal(self, range_id: str, candle_ref: ReferenceCandle,
-                             candle_breakout: CandleData, is_true_breakout: bool = False) -> TradeSignal:
-        """Generate SELL signal for a specific range.
+                             candle_breakout: CandleData, is_true_breakout: bool = False,
+                             df: Optional[pd.DataFrame] = None,
+                             state: Optional[UnifiedBreakoutState] = None) -> TradeSignal:
+        """Generate SELL signal for a specific range (see _generate_signal)."""
+        return self._generate_signal(_SELL_SIGNAL, range_id, candle_ref, candle_breakout,
+                                     is_true_breakout, df, state)
+
+    def _generate_signal(self, side: _SignalSide, range_id: str, candle_ref: ReferenceCandle,
+                         candle_breakout: CandleData, is_true_breakout: bool = False,
+                         df: Optional[pd.DataFrame] = None,
+                         state: Optional[UnifiedBreakoutState] = None) -> TradeSignal:
+        """Generate a BUY or SELL signal for a specific range.
 
         Args:
+            side: Signal direction (_BUY_SIGNAL or _SELL_SIGNAL)
             range_id: Range identifier
             candle_ref: Reference candle
             candle_breakout: Breakout candle
             is_true_breakout: True if this is a true breakout (continuation), False if false breakout (reversal)
+            df: Breakout candles already fetched this check (optional)
+            state: Breakout state of the range, looked up if not given
         """
-        # Find the HIGHEST HIGH among the last 10 candles that closed ABOVE reference high
+        # BUY: find the LOWEST LOW among the last 10 candles (SL goes below it)
+        # SELL: find the HIGHEST HIGH among the last 10 candles (SL goes above it)
         # This matches the main StrategyEngine logic
-        highest_high = self._find_highest_high_in_pattern(range_id, candle_ref.high)
+        if side.direction > 0:
+            extreme = self._find_lowest_low_in_pattern(range_id, candle_ref.low, df)
+            reference_price = candle_ref.low
+        else:
+            extreme = self._find_highest_high_in_pattern(range_id, candle_ref.high, df)
+            reference_price = candle_ref.high
 
-        if highest_high is None:
-            self.logger.warning(f"No valid highest high found for SELL signal [{range_id}]", self.symbol)
-            highest_high = candle_ref.high  # Fallback to reference high
+        if extreme is None:
+            self.logger.warning(f"No valid {side.extreme_label} found for {side.label} signal [{range_id}]", self.symbol)
+            extreme = reference_price  # Fallback to reference level
 
-        # Entry: Will use current BID price at execution
+        # Entry: Will use current ASK (BUY) / BID (SELL) price at execution
         entry = candle_breakout.close
 
-        # Stop Loss: Above the HIGHEST HIGH (same logic for both TRUE and FALSE strategies)
+        # Stop Loss: Beyond the pattern extreme (same logic for both TRUE and FALSE strategies)
         # Use point-based or percentage-based calculation
-        sl_offset = self._calculate_sl_offset(highest_high)
+        # Symbol info is shared by the SL offset and spread calculations
+        symbol_info = self.connector.get_symbol_info(self.symbol) if self.connector is not None else None
+        sl_offset = self._calculate_sl_offset(extreme, symbol_info)
 
         # Add spread to SL to account for bid-ask spread
-        # For SELL: Entry at BID, SL triggered when ASK hits SL
+        # BUY: Entry at ASK, SL triggered when BID hits SL (and vice versa for SELL)
         # So we need to widen SL by spread amount
         spread_price = 0.0
-        if self.connector is not None:
-            symbol_info = self.connector.get_symbol_info(self.symbol)
-            if symbol_info is not None:
-                spread_points = self.connector.get_spread(self.symbol)
-                if spread_points is not None:
-                    point = symbol_info['point']
-                    spread_price = spread_points * point
-                    self.logger.debug(
-                        f"Adding spread to SELL SL [{range_id}]: {spread_points:.1f} points = {spread_price:.5f}",
-                        self.symbol
-                    )
+        if symbol_info is not None:
+            spread_points = self.connector.get_spread(self.symbol)
+            if spread_points is not None:
+                point = symbol_info['point']
+                spread_price = spread_points * point
+                self.logger.debug(
+                    f"Adding spread to {side.label} SL [{range_id}]: {spread_points:.1f} points = {spread_price:.5f}",
+                    self.symbol
+                )
 
-        sl = highest_high + sl_offset + spread_price
+        # Widen away from entry: below for BUY, above for SELL
+        sl = extreme - side.direction * sl_offset - side.direction * spread_price
 
         # Take Profit: Based on R:R ratio
         # Note: TP will be recalculated in order_manager using actual execution price
-        risk = sl - entry
-        tp = entry - (risk * self.strategy_config.risk_reward_ratio)
+        tp = _take_profit(entry, sl, self._rr)
 
         # Get state for this range to track confirmations
-        state = self.multi_range_state.get_state(range_id)
+        if state is None:
+            state = self.multi_range_state.get_state(range_id)
 
         # Determine confirmation status based on strategy type
-        if is_true_breakout:
-            # TRUE BREAKOUT: Volume confirmed = breakout volume HIGH + retest occurred + continuation volume HIGH
-            volume_confirmed = (state.true_sell_volume_ok and
-                              state.true_sell_retest_ok and
-                              state.true_sell_continuation_volume_ok)
-            divergence_confirmed = False  # Not used for true breakouts
-        else:
-            # FALSE BREAKOUT: Volume confirmed = breakout volume LOW + reversal volume HIGH
-            volume_confirmed = (state.false_sell_volume_ok and
-                              state.false_sell_reversal_volume_ok)
-            divergence_confirmed = state.false_sell_divergence_ok
+        confirmations = side.true_confirmations if is_true_breakout else side.false_confirmations
+        volume_confirmed, divergence_confirmed = confirmations(state)
 
         return TradeSignal(
             symbol=self.symbol,
-            signal_type=PositionType.SELL,
+            signal_type=side.position_type,
             entry_price=entry,
             stop_loss=sl,
             take_profit=tp,
             lot_size=0.0,  # Will be calculated by risk manager
             timestamp=candle_breakout.time,
             range_id=range_id,
-            reason=f"{'True' if is_true_breakout else 'False'} breakout strategy - Range: {range_id}",
-            max_spread_percent=self.symbol_params.max_spread_percent,
+            reason=self._signal_reason(range_id, is_true_breakout),
+            max_spread_percent=self._max_spread,
             is_true_breakout=is_true_breakout,
             volume_confirmed=volume_confirmed,
             divergence_confirmed=divergence_confirmed
@@ -873,10 +1010,10 @@ class MultiRangeStrategyEngine:
     def reset_range(self, range_id: str):
         """Reset state for a specific range configuration."""
         self.multi_range_state.reset_range(range_id)
-        self.logger.info(f"Range state reset for {range_id}", self.symbol)
+        self.logger.info_lazy(self._RANGE_RESET_FMT, range_id, symbol=self.symbol)
 
     def reset_all_ranges(self):
         """Reset all range states."""
         self.multi_range_state.reset_all()
-        self.logger.info("All range states reset", self.symbol)
+        self.logger.info_lazy("All range states reset", symbol=self.symbol)
 
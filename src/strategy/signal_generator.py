@@ -62,14 +62,11 @@ class SignalGenerator:
         if candles_df is None or len(candles_df) == 0:
             return None
         
-        # Get last 10 candles
-        last_10 = candles_df.tail(10)
-        
-        if len(last_10) == 0:
-            return None
+        # Last 10 candles as a plain array (no per-call pandas reductions)
+        last_10 = candles_df['high'].to_numpy()[-10:]
         
         # Find the highest high among all candles
-        highest_high = last_10['high'].max()
+        highest_high = float(last_10.max())
         
         self.logger.debug(
             f"Pattern detection: Found highest high = {highest_high:.5f} "
@@ -94,14 +91,11 @@ class SignalGenerator:
         if candles_df is None or len(candles_df) == 0:
             return None
         
-        # Get last 10 candles
-        last_10 = candles_df.tail(10)
-        
-        if len(last_10) == 0:
-            return None
+        # Last 10 candles as a plain array (no per-call pandas reductions)
+        last_10 = candles_df['low'].to_numpy()[-10:]
         
         # Find the lowest low among all candles
-        lowest_low = last_10['low'].min()
+        lowest_low = float(last_10.min())
         
         self.logger.debug(
             f"Pattern detection: Found lowest low = {lowest_low:.5f} "
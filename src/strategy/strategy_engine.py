@@ -2,7 +2,9 @@
 Core strategy logic for false breakout detection.
 Ported from FMS_Strategy.mqh
 """
-from typing import Optional
+import logging
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
 from datetime import datetime, timezone, timedelta
 import pandas as pd
 from src.models.data_models import (
@@ -10,13 +12,163 @@ from src.models.data_models import (
     PositionType, SymbolParameters
 )
 from src.strategy.candle_processor import CandleProcessor
+from src.strategy.breakout_sides import ClassificationSide, build_classification_sides
 from src.indicators.technical_indicators import TechnicalIndicators
 from src.config.config import StrategyConfig
 from src.utils.logger import get_logger
+from src.constants import LOG_SEPARATOR_CHAR, LOG_SEPARATOR_LENGTH
+
+
+# Breakout above 4H high: TRUE BUY / FALSE SELL, below 4H low: TRUE SELL / FALSE BUY
+_ABOVE_SIDE, _BELOW_SIDE = build_classification_sides("4H High", "4H Low")
+
+
+@dataclass(frozen=True)
+class _SignalSide:
+    """Kind- and direction-specific parts of signal generation"""
+    position_type: PositionType
+    label: str
+    direction: int  # +1: SL below the entry (BUY), -1: SL above the entry (SELL)
+    confirmations: Callable[[UnifiedBreakoutState], Tuple[bool, bool]]  # (volume, divergence) confirmed
+    is_true_breakout: bool
+    reason: str
+    extreme_label: str
+    level_label: str
+    level_is_high: bool
+    pattern_label: Optional[str]
+    stop_loss_note: str
+    take_profit_note: str
+
+
+_FALSE_BUY_SIGNAL = _SignalSide(
+    position_type=PositionType.BUY,
+    label="BUY",
+    direction=1,
+    confirmations=UnifiedBreakoutState.false_buy_confirmations,
+    is_true_breakout=False,
+    reason="False breakout below 4H low with reversal",
+    extreme_label="lowest low",
+    level_label="4H Low",
+    level_is_high=False,
+    pattern_label="Lowest Low in Pattern",
+    stop_loss_note="includes spread adjustment",
+    take_profit_note=" (will be recalculated at execution)"
+)
+
+_FALSE_SELL_SIGNAL = _SignalSide(
+    position_type=PositionType.SELL,
+    label="SELL",
+    direction=-1,
+    confirmations=UnifiedBreakoutState.false_sell_confirmations,
+    is_true_breakout=False,
+    reason="False breakout above 4H high with reversal",
+    extreme_label="highest high",
+    level_label="4H High",
+    level_is_high=True,
+    pattern_label="Highest High in Pattern",
+    stop_loss_note="includes spread adjustment",
+    take_profit_note=" (will be recalculated at execution)"
+)
+
+_TRUE_BUY_SIGNAL = _SignalSide(
+    position_type=PositionType.BUY,
+    label="TRUE BUY",
+    direction=1,
+    confirmations=UnifiedBreakoutState.true_buy_confirmations,
+    is_true_breakout=True,
+    reason="True breakout above 4H high with continuation",
+    extreme_label="lowest low",
+    level_label="4H High (breakout level)",
+    level_is_high=True,
+    pattern_label=None,
+    stop_loss_note="below 4H high",
+    take_profit_note=""
+)
+
+_TRUE_SELL_SIGNAL = _SignalSide(
+    position_type=PositionType.SELL,
+    label="TRUE SELL",
+    direction=-1,
+    confirmations=UnifiedBreakoutState.true_sell_confirmations,
+    is_true_breakout=True,
+    reason="True breakout below 4H low with continuation",
+    extreme_label="highest high",
+    level_label="4H Low (breakout level)",
+    level_is_high=False,
+    pattern_label=None,
+    stop_loss_note="above 4H low",
+    take_profit_note=""
+)
 
 
 class StrategyEngine:
     """Implements the false breakout strategy logic"""
+
+    _SEP = LOG_SEPARATOR_CHAR * LOG_SEPARATOR_LENGTH
+    _BREAKOUT_BANNER_FMT = (
+        "%s\n"
+        ">>> BREAKOUT %s %s DETECTED <<<\n"
+        "5M Open: %.5f (inside 4H range ✓)\n"
+        "5M Close: %.5f (%s %s ✓)\n"
+        "4H High: %.5f\n"
+        "4H Low: %.5f\n"
+        "4H Candle Time: %s\n"
+        "Breakout Candle Time: %s\n"
+        "Breakout Volume: %s\n"
+        "Timeout will occur at: %s\n"
+        "%s"
+    )
+    _TIMEOUT_CHECK_FMT = "[TIMEOUT CHECK %s] Age=%dmin, Limit=%dmin, Breakout=%s, Current=%s"
+    _TIMEOUT_VALID_FMT = "[TIMEOUT CHECK %s] Breakout still valid (%d/%d min)"
+    _TIMEOUT_BANNER_FMT = (
+        "%s\n"
+        ">>> BREAKOUT %s TIMEOUT - Resetting <<<\n"
+        "Breakout Age: %d minutes (%dh %dm)\n"
+        "Timeout Limit: %d minutes (%d candles)\n"
+        "Breakout Time: %s\n"
+        "Current Time: %s\n"
+        "Reason: Breakout too old, momentum lost\n"
+        "%s"
+    )
+    _TRUE_QUALIFIED_FMT = (
+        ">>> %s QUALIFIED (%s) <<<\n"
+        "%s"
+    )
+    _FALSE_QUALIFIED_FMT = (
+        ">>> %s QUALIFIED (Low Vol %s, Div %s) <<<\n"
+        "%s"
+    )
+    _REVERSAL_DETECTED_FMT = (
+        ">>> %s REVERSAL DETECTED (Rev Vol %s) <<<\n"
+        "5M Close: %.5f\n"
+        "%s: %.5f\n"
+        "Reversal Volume: %s\n"
+        "Waiting for next candle to confirm reversal direction..."
+    )
+    _REVERSAL_CONFIRMED_FMT = (
+        ">>> %s REVERSAL CONFIRMED <<<\n"
+        "Confirmation Close: %.5f\n"
+        "%s: %.5f\n"
+        "*** %s SIGNAL GENERATED ***"
+    )
+    _REVERSAL_FAILED_FMT = (
+        ">>> %s REVERSAL FAILED - Price back %s <<<\n"
+        "Resetting %s state..."
+    )
+    _RETEST_DETECTED_FMT = (
+        ">>> %s RETEST DETECTED (Retest ✓) <<<\n"
+        "5M Close: %.5f\n"
+        "%s: %.5f\n"
+        "Retest Range: %.5f\n"
+        "%s"
+    )
+    _CONTINUATION_DETECTED_FMT = (
+        ">>> %s CONTINUATION DETECTED (Retest %s, Cont Vol %s) <<<\n"
+        "5M Close: %.5f\n"
+        "%s: %.5f\n"
+        "Continuation Volume: %s\n"
+        "*** %s SIGNAL GENERATED ***"
+    )
     
     def __init__(self, symbol: str, candle_processor: CandleProcessor,
                  indicators: TechnicalIndicators, strategy_config: StrategyConfig,
@@ -52,6 +204,19 @@ class StrategyEngine:
         self.false_reversal_volume = 0
         self.true_breakout_volume = 0
         self.true_continuation_volume = 0
+
+        # Breakout timeout in 5M candles, fixed for the engine's lifetime
+        self._timeout_minutes = self.symbol_params.breakout_timeout_candles * 5
+        self._timeout_delta = timedelta(minutes=self._timeout_minutes)
+        self._timeout_seconds = self._timeout_minutes * 60
+
+        # Signal constants read on every generated signal
+        # strategy_config and symbol_params are not modified after construction
+        self._rr = float(strategy_config.risk_reward_ratio)
+        self._max_spread = self.symbol_params.max_spread_percent
+        self._use_point_sl = strategy_config.use_point_based_sl
+        self._sl_points = strategy_config.stop_loss_offset_points
+        self._sl_percent = strategy_config.stop_loss_offset_percent
     
     def check_for_signal(self) -> Optional[TradeSignal]:
         """
@@ -88,13 +253,27 @@ class StrategyEngine:
         # === STAGE 1: UNIFIED BREAKOUT DETECTION ===
         self._detect_breakout(candle_4h, candle_5m)
 
+        # Nothing to classify or confirm until a breakout is live
+        if not self.unified_state.has_active_breakout():
+            return None
+
+        # 5M history and average volume shared by every check below
+        df = self.candle_processor.get_5m_candles(count=100)
+        avg_volume = None
+        if df is not None:
+            avg_volume = self.indicators.calculate_average_volume_np(
+                df['tick_volume'].to_numpy(),
+                self.symbol_params.volume_average_period
+            )
+
         # === STAGE 2: STRATEGY CLASSIFICATION ===
-        # Classify which strategies can proceed based on volume
-        self._classify_strategies(candle_5m)
+        # Classify which strategies can proceed based on volume (once per breakout side)
+        if self.unified_state.classification_pending():
+            self._classify_strategies(candle_5m, df, avg_volume)
 
         # === STAGE 3 & 4: CHECK FOR SIGNALS ===
         # Check if any strategy has generated a signal
-        signal = self._check_all_strategies(candle_4h, candle_5m)
+        signal = self._check_all_strategies(candle_4h, candle_5m, avg_volume)
         if signal:
             return signal
 
@@ -125,6 +304,10 @@ class StrategyEngine:
         # Check for timeout on existing breakouts FIRST
         self._check_breakout_timeout(candle_5m)
 
+        # Both directions require the 5M candle to open INSIDE the 4H range
+        if not (candle_4h.low <= candle_5m.open <= candle_4h.high):
+            return
+
         # Check for breakout ABOVE 4H high
         if not self.unified_state.breakout_above_detected:
             self._detect_breakout_above(candle_4h, candle_5m)
@@ -137,18 +320,15 @@ class StrategyEngine:
         """
         Detect breakout above 4H high.
 
+        The caller has already checked that the 5M candle opened inside the 4H range.
+
         Args:
             candle_4h: 4H candle with high/low range
             candle_5m: Current 5M candle
         """
-        # Validate: Open INSIDE 4H range AND Close ABOVE 4H high
-        open_inside_range = candle_5m.open >= candle_4h.low and candle_5m.open <= candle_4h.high
-        close_above_high = candle_5m.close > candle_4h.high
-
-        if open_inside_range and close_above_high:
-            self.unified_state.breakout_above_detected = True
-            self.unified_state.breakout_above_volume = candle_5m.volume
-            self.unified_state.breakout_above_time = candle_5m.time
+        # Validate: Close ABOVE 4H high
+        if candle_5m.close > candle_4h.high:
+            self.unified_state.mark_breakout_above(candle_5m.time, candle_5m.volume)
 
             self._log_breakout_detection(
                 direction="ABOVE",
@@ -162,18 +342,15 @@ class StrategyEngine:
         """
         Detect breakout below 4H low.
 
+        The caller has already checked that the 5M candle opened inside the 4H range.
+
         Args:
             candle_4h: 4H candle with high/low range
             candle_5m: Current 5M candle
         """
-        # Validate: Open INSIDE 4H range AND Close BELOW 4H low
-        open_inside_range = candle_5m.open >= candle_4h.low and candle_5m.open <= candle_4h.high
-        close_below_low = candle_5m.close < candle_4h.low
-
-        if open_inside_range and close_below_low:
-            self.unified_state.breakout_below_detected = True
-            self.unified_state.breakout_below_volume = candle_5m.volume
-            self.unified_state.breakout_below_time = candle_5m.time
+        # Validate: Close BELOW 4H low
+        if candle_5m.close < candle_4h.low:
+            self.unified_state.mark_breakout_below(candle_5m.time, candle_5m.volume)
 
             self._log_breakout_detection(
                 direction="BELOW",
@@ -195,19 +372,17 @@ class StrategyEngine:
             level: Price level that was broken
             level_name: Human-readable name of the level
         """
-        timeout_time = candle_5m.time + timedelta(minutes=self.symbol_params.breakout_timeout_candles * 5)
-
-        self.logger.info("=" * 60, self.symbol)
-        self.logger.info(f">>> BREAKOUT {direction} {level_name.upper()} DETECTED <<<", self.symbol)
-        self.logger.info(f"5M Open: {candle_5m.open:.5f} (inside 4H range ✓)", self.symbol)
-        self.logger.info(f"5M Close: {candle_5m.close:.5f} ({direction.lower()} {level_name} ✓)", self.symbol)
-        self.logger.info(f"4H High: {candle_4h.high:.5f}", self.symbol)
-        self.logger.info(f"4H Low: {candle_4h.low:.5f}", self.symbol)
-        self.logger.info(f"4H Candle Time: {candle_4h.time}", self.symbol)
-        self.logger.info(f"Breakout Candle Time: {candle_5m.time}", self.symbol)
-        self.logger.info(f"Breakout Volume: {candle_5m.volume}", self.symbol)
-        self.logger.info(f"Timeout will occur at: {timeout_time}", self.symbol)
-        self.logger.info("=" * 60, self.symbol)
+        if not self.logger.isEnabledFor(logging.INFO, self.symbol):
+            return
+        timeout_time = candle_5m.time + self._timeout_delta
+
+        self.logger.info_lazy(
+            self._BREAKOUT_BANNER_FMT,
+            self._SEP, direction, level_name.upper(), candle_5m.open, candle_5m.close,
+            direction.lower(), level_name, candle_4h.high, candle_4h.low, candle_4h.time,
+            candle_5m.time, candle_5m.volume, timeout_time, self._SEP,
+            symbol=self.symbol
+        )
 
 
     def _check_breakout_timeout(self, candle_5m: CandleData):
@@ -220,8 +395,14 @@ class StrategyEngine:
         Args:
             candle_5m: Current 5M candle with timestamp
         """
-        timeout_minutes = self.symbol_params.breakout_timeout_candles * 5  # Convert candles to minutes
-        timeout_delta = timedelta(minutes=timeout_minutes)
+        # Nothing can time out until a breakout is detected
+        if not self.unified_state.has_active_breakout():
+            return
+
+        timeout_minutes = self._timeout_minutes
+        timeout_seconds = self._timeout_seconds
+        # Ages are compared as plain seconds against the stored breakout timestamps
+        current_ts = candle_5m.time.timestamp()
 
         # Check breakout ABOVE timeout
         if self.unified_state.breakout_above_detected and self.unified_state.breakout_above_time:
@@ -229,7 +410,8 @@ class StrategyEngine:
                 direction="ABOVE",
                 breakout_time=self.unified_state.breakout_above_time,
                 current_time=candle_5m.time,
-                timeout_delta=timeout_delta,
+                age_seconds=current_ts - self.unified_state.breakout_above_time_ts,
+                timeout_seconds=timeout_seconds,
                 timeout_minutes=timeout_minutes,
                 reset_callback=self.unified_state.reset_breakout_above
             )
@@ -240,14 +422,15 @@ class StrategyEngine:
                 direction="BELOW",
                 breakout_time=self.unified_state.breakout_below_time,
                 current_time=candle_5m.time,
-                timeout_delta=timeout_delta,
+                age_seconds=current_ts - self.unified_state.breakout_below_time_ts,
+                timeout_seconds=timeout_seconds,
                 timeout_minutes=timeout_minutes,
                 reset_callback=self.unified_state.reset_breakout_below
             )
 
     def _check_single_breakout_timeout(self, direction: str, breakout_time: datetime,
-                                       current_time: datetime, timeout_delta: timedelta,
-                                       timeout_minutes: int, reset_callback):
+                                       current_time: datetime, age_seconds: float,
+                                       timeout_seconds: int, timeout_minutes: int, reset_callback):
         """
         Check timeout for a single breakout direction.
 
@@ -255,24 +438,21 @@ class StrategyEngine:
             direction: "ABOVE" or "BELOW"
             breakout_time: When the breakout occurred
             current_time: Current candle time
-            timeout_delta: Timeout duration as timedelta
+            age_seconds: Breakout age in seconds
+            timeout_seconds: Timeout duration in seconds
             timeout_minutes: Timeout duration in minutes
             reset_callback: Function to call to reset the breakout
         """
-        age = current_time - breakout_time
-        age_minutes = int(age.total_seconds() / 60)
+        age_minutes = int(age_seconds // 60)
 
         # ALWAYS log timeout check for active breakouts (not just debug)
-        self.logger.info(
-            f"[TIMEOUT CHECK {direction}] Age={age_minutes}min, Limit={timeout_minutes}min, "
-            f"Breakout={breakout_time}, Current={current_time}",
-            self.symbol
-        )
+        self.logger.info_lazy(self._TIMEOUT_CHECK_FMT, direction, age_minutes, timeout_minutes,
+                              breakout_time, current_time, symbol=self.symbol)
 
         # Validate age is positive (handle timezone issues)
-        if age.total_seconds() < 0:
+        if age_seconds < 0:
             self.logger.warning(
-                f"Negative breakout age detected: {age.total_seconds()}s - possible timezone issue",
+                f"Negative breakout age detected: {age_seconds}s - possible timezone issue",
                 self.symbol
             )
             self.logger.warning(
@@ -281,31 +461,23 @@ class StrategyEngine:
             )
             return
 
-        if age > timeout_delta:
+        if age_seconds > timeout_seconds:
             # Breakout timed out - reset it
-            self.logger.info("=" * 60, self.symbol)
-            self.logger.info(f">>> BREAKOUT {direction} TIMEOUT - Resetting <<<", self.symbol)
-            self.logger.info(
-                f"Breakout Age: {age_minutes} minutes ({age_minutes // 60}h {age_minutes % 60}m)",
-                self.symbol
+            self.logger.info_lazy(
+                self._TIMEOUT_BANNER_FMT,
+                self._SEP, direction, age_minutes, age_minutes // 60, age_minutes % 60,
+                timeout_minutes, self.symbol_params.breakout_timeout_candles,
+                breakout_time, current_time, self._SEP,
+                symbol=self.symbol
             )
-            self.logger.info(
-                f"Timeout Limit: {timeout_minutes} minutes ({self.symbol_params.breakout_timeout_candles} candles)",
-                self.symbol
-            )
-            self.logger.info(f"Breakout Time: {breakout_time}", self.symbol)
-            self.logger.info(f"Current Time: {current_time}", self.symbol)
-            self.logger.info("Reason: Breakout too old, momentum lost", self.symbol)
-            self.logger.info("=" * 60, self.symbol)
             reset_callback()
         else:
             # Breakout still valid
-            self.logger.info(
-                f"[TIMEOUT CHECK {direction}] Breakout still valid ({age_minutes}/{timeout_minutes} min)",
-                self.symbol
-            )
+            self.logger.info_lazy(self._TIMEOUT_VALID_FMT, direction, age_minutes, timeout_minutes,
+                                  symbol=self.symbol)
 
-    def _classify_strategies(self, candle_5m: CandleData):
+    def _classify_strategies(self, candle_5m: CandleData, df: Optional[pd.DataFrame],
+                             avg_volume: Optional[float]):
         """
         STAGE 2: Strategy classification and confirmation tracking.
 
@@ -315,111 +487,84 @@ class StrategyEngine:
 
         Confirmations are TRACKED but NOT REQUIRED for trade execution.
         This allows analysis of which confirmations correlate with winning trades.
+
+        Args:
+            candle_5m: Current 5M candle
+            df: Recent 5M candles fetched for this check (None if unavailable)
+            avg_volume: Average 5M volume for this check (None if unavailable)
         """
-        # Get 5M candles for average volume calculation
-        df = self.candle_processor.get_5m_candles(count=100)
-        if df is None:
+        if df is None or avg_volume is None:
             return
 
-        # Calculate average volume
-        avg_volume = self.indicators.calculate_average_volume(
-            df['tick_volume'],
-            self.symbol_params.volume_average_period
-        )
+        state = self.unified_state
 
         # === CLASSIFY BREAKOUT ABOVE (TRUE BUY / FALSE SELL) ===
-        if self.unified_state.breakout_above_detected and not self.unified_state.true_buy_qualified and not self.unified_state.false_sell_qualified:
-            volume = self.unified_state.breakout_above_volume
-
-            # Check if qualifies for TRUE BUY (high volume continuation)
-            if self.symbol_params.enable_true_breakout_strategy:
-                # Check volume confirmation (tracked but not required)
-                is_high_volume = self.indicators.is_true_breakout_volume_high(
-                    volume, avg_volume,
-                    self.symbol_params.true_breakout_volume_min,
-                    self.symbol
-                )
-
-                # Always qualify, but track volume confirmation status
-                self.unified_state.true_buy_qualified = True
-                self.unified_state.true_buy_volume_ok = is_high_volume
-
-                if is_high_volume:
-                    self.logger.info(">>> TRUE BUY QUALIFIED (High Volume ✓) <<<", self.symbol)
-                else:
-                    self.logger.info(">>> TRUE BUY QUALIFIED (Volume not high ✗) <<<", self.symbol)
-                self.logger.info("Waiting for continuation above 4H High...", self.symbol)
+        if state.breakout_above_detected and not state.true_buy_qualified and not state.false_sell_qualified:
+            self._classify_side(_ABOVE_SIDE, state.breakout_above_volume, df, avg_volume)
 
-            # Check if qualifies for FALSE SELL (low volume reversal)
-            if self.symbol_params.enable_false_breakout_strategy:
-                # Check volume confirmation (tracked but not required)
-                is_low_volume = self.indicators.is_breakout_volume_low(
-                    volume, avg_volume,
-                    self.symbol_params.breakout_volume_max,
-                    self.symbol
-                )
-
-                # Check divergence (tracked but not required)
-                divergence_ok = self._check_sell_divergence()
-
-                # Always qualify, but track confirmation status
-                self.unified_state.false_sell_qualified = True
-                self.unified_state.false_sell_volume_ok = is_low_volume
-                self.unified_state.false_sell_divergence_ok = divergence_ok
+        # === CLASSIFY BREAKOUT BELOW (TRUE SELL / FALSE BUY) ===
+        if state.breakout_below_detected and not state.true_sell_qualified and not state.false_buy_qualified:
+            self._classify_side(_BELOW_SIDE, state.breakout_below_volume, df, avg_volume)
 
-                # Log confirmation status
-                vol_status = "✓" if is_low_volume else "✗"
-                div_status = "✓" if divergence_ok else "✗"
-                self.logger.info(f">>> FALSE SELL QUALIFIED (Low Vol {vol_status}, Div {div_status}) <<<", self.symbol)
-                self.logger.info("Waiting for reversal back below 4H High...", self.symbol)
+    def _classify_side(self, side: ClassificationSide, volume: int, df: pd.DataFrame, avg_volume: float):
+        """
+        Classify one breakout side into its TRUE and FALSE strategies.
 
-        # === CLASSIFY BREAKOUT BELOW (TRUE SELL / FALSE BUY) ===
-        if self.unified_state.breakout_below_detected and not self.unified_state.true_sell_qualified and not self.unified_state.false_buy_qualified:
-            volume = self.unified_state.breakout_below_volume
-
-            # Check if qualifies for TRUE SELL (high volume continuation)
-            if self.symbol_params.enable_true_breakout_strategy:
-                # Check volume confirmation (tracked but not required)
-                is_high_volume = self.indicators.is_true_breakout_volume_high(
-                    volume, avg_volume,
-                    self.symbol_params.true_breakout_volume_min,
-                    self.symbol
-                )
+        Args:
+            side: Strategy setters and messages for the breakout side
+            volume: Breakout candle volume
+            df: Recent 5M candles fetched for this check
+            avg_volume: Average 5M volume for this check
+        """
+        state = self.unified_state
+        params = self.symbol_params
+        true_enabled = params.enable_true_breakout_strategy
+        false_enabled = params.enable_false_breakout_strategy
+        if not (true_enabled or false_enabled):
+            return
 
-                # Always qualify, but track volume confirmation status
-                self.unified_state.true_sell_qualified = True
-                self.unified_state.true_sell_volume_ok = is_high_volume
+        # Check volume confirmation for both strategies in one pass (tracked but not required)
+        # TRUE breakout wants HIGH volume, FALSE breakout wants LOW volume
+        is_high_volume, is_low_volume = self.indicators.check_breakout_volume(
+            volume, avg_volume,
+            params.true_breakout_volume_min if true_enabled else None,
+            params.breakout_volume_max if false_enabled else None,
+            self.symbol
+        )
 
-                if is_high_volume:
-                    self.logger.info(">>> TRUE SELL QUALIFIED (High Volume ✓) <<<", self.symbol)
-                else:
-                    self.logger.info(">>> TRUE SELL QUALIFIED (Volume not high ✗) <<<", self.symbol)
-                self.logger.info("Waiting for continuation below 4H Low...", self.symbol)
+        # Check if qualifies for TRUE breakout (high volume continuation)
+        if true_enabled:
+            # Always qualify, but track volume confirmation status
+            side.qualify_true(state, is_high_volume)
 
-            # Check if qualifies for FALSE BUY (low volume reversal)
-            if self.symbol_params.enable_false_breakout_strategy:
-                # Check volume confirmation (tracked but not required)
-                is_low_volume = self.indicators.is_breakout_volume_low(
-                    volume, avg_volume,
-                    self.symbol_params.breakout_volume_max,
-                    self.symbol
-                )
+            self.logger.info_lazy(
+                self._TRUE_QUALIFIED_FMT,
+                side.true_label, "High Volume ✓" if is_high_volume else "Volume not high ✗",
+                side.true_waiting_message,
+                symbol=self.symbol
+            )
 
-                # Check divergence (tracked but not required)
-                divergence_ok = self._check_buy_divergence()
+        # Check if qualifies for FALSE breakout (low volume reversal)
+        if false_enabled:
+            # Check divergence (tracked but not required)
+            if side.bullish_divergence:
+                divergence_ok = self._check_buy_divergence(df)
+            else:
+                divergence_ok = self._check_sell_divergence(df)
 
-                # Always qualify, but track confirmation status
-                self.unified_state.false_buy_qualified = True
-                self.unified_state.false_buy_volume_ok = is_low_volume
-                self.unified_state.false_buy_divergence_ok = divergence_ok
+            # Always qualify, but track confirmation status
+            side.qualify_false(state, is_low_volume, divergence_ok)
 
-                # Log confirmation status
-                vol_status = "✓" if is_low_volume else "✗"
-                div_status = "✓" if divergence_ok else "✗"
-                self.logger.info(f">>> FALSE BUY QUALIFIED (Low Vol {vol_status}, Div {div_status}) <<<", self.symbol)
-                self.logger.info("Waiting for reversal back above 4H Low...", self.symbol)
+            # Log confirmation status
+            self.logger.info_lazy(
+                self._FALSE_QUALIFIED_FMT,
+                side.false_label, "✓" if is_low_volume else "✗", "✓" if divergence_ok else "✗",
+                side.false_waiting_message,
+                symbol=self.symbol
+            )
 
-    def _check_all_strategies(self, candle_4h: FourHourCandle, candle_5m: CandleData) -> Optional[TradeSignal]:
+    def _check_all_strategies(self, candle_4h: FourHourCandle, candle_5m: CandleData,
+                              avg_volume: Optional[float]) -> Optional[TradeSignal]:
         """
         STAGE 3 & 4: Check all qualified strategies for signals.
 
@@ -428,193 +573,190 @@ class StrategyEngine:
         - FALSE SELL: Reversal back below 4H high (if qualified)
         - TRUE BUY: Continuation above 4H high (if qualified)
         - TRUE SELL: Continuation below 4H low (if qualified)
+
+        Args:
+            candle_4h: Current 4H candle
+            candle_5m: Current 5M candle
+            avg_volume: Average 5M volume for this check (None if unavailable)
         """
+        state = self.unified_state
+        high_4h = candle_4h.high
+        low_4h = candle_4h.low
+        close = candle_5m.close
+        volume = candle_5m.volume
+
         # === FALSE BUY: Check for reversal back above 4H low ===
-        if self.unified_state.false_buy_qualified and not self.unified_state.false_buy_reversal_detected:
-            if candle_5m.close > candle_4h.low:
-                self.unified_state.false_buy_reversal_detected = True
-                self.unified_state.false_buy_reversal_volume = candle_5m.volume
+        if state.false_buy_qualified and not state.false_buy_reversal_detected:
+            if close > low_4h:
+                state.false_buy_reversal_detected = True
+                state.false_buy_reversal_volume = volume
 
                 # Check reversal volume (tracked but not required)
-                reversal_volume_ok = self._check_unified_reversal_volume(candle_5m.volume)
-                self.unified_state.false_buy_reversal_volume_ok = reversal_volume_ok
-
-                vol_status = "✓" if reversal_volume_ok else "✗"
-                self.logger.info(f">>> FALSE BUY REVERSAL DETECTED (Rev Vol {vol_status}) <<<", self.symbol)
-                self.logger.info(f"5M Close: {candle_5m.close:.5f}", self.symbol)
-                self.logger.info(f"4H Low: {candle_4h.low:.5f}", self.symbol)
-                self.logger.info(f"Reversal Volume: {candle_5m.volume}", self.symbol)
-                self.logger.info(f"Waiting for next candle to confirm reversal direction...", self.symbol)
+                reversal_volume_ok = self._check_unified_reversal_volume(volume, avg_volume)
+                state.false_buy_reversal_volume_ok = reversal_volume_ok
+
+                self.logger.info_lazy(
+                    self._REVERSAL_DETECTED_FMT,
+                    "FALSE BUY", "✓" if reversal_volume_ok else "✗",
+                    close, "4H Low", low_4h, volume,
+                    symbol=self.symbol
+                )
 
         # === FALSE BUY: Check for confirmation candle after reversal ===
-        elif self.unified_state.false_buy_reversal_detected and not self.unified_state.false_buy_reversal_confirmed:
+        elif state.false_buy_reversal_detected and not state.false_buy_reversal_confirmed:
             # Confirmation: next candle continues in reversal direction (stays above 4H low)
-            if candle_5m.close > candle_4h.low:
-                self.unified_state.false_buy_reversal_confirmed = True
+            if close > low_4h:
+                state.false_buy_reversal_confirmed = True
 
-                self.logger.info(f">>> FALSE BUY REVERSAL CONFIRMED <<<", self.symbol)
-                self.logger.info(f"Confirmation Close: {candle_5m.close:.5f}", self.symbol)
-                self.logger.info(f"4H Low: {candle_4h.low:.5f}", self.symbol)
-                self.logger.info("*** FALSE BUY SIGNAL GENERATED ***", self.symbol)
+                self.logger.info_lazy(
+                    self._REVERSAL_CONFIRMED_FMT,
+                    "FALSE BUY", close, "4H Low", low_4h, "FALSE BUY",
+                    symbol=self.symbol
+                )
                 return self._generate_buy_signal(candle_4h, candle_5m)
             else:
                 # Reversal failed - price went back below 4H low
-                self.logger.info(f">>> FALSE BUY REVERSAL FAILED - Price back below 4H low <<<", self.symbol)
-                self.logger.info(f"Resetting false buy state...", self.symbol)
-                self.unified_state.false_buy_qualified = False
-                self.unified_state.false_buy_reversal_detected = False
-                self.unified_state.false_buy_reversal_volume = 0
-                self.unified_state.false_buy_volume_ok = False
-                self.unified_state.false_buy_reversal_volume_ok = False
+                self.logger.info_lazy(self._REVERSAL_FAILED_FMT, "FALSE BUY", "below 4H low", "false buy",
+                                      symbol=self.symbol)
+                state.false_buy_qualified = False
+                state.false_buy_reversal_detected = False
+                state.false_buy_reversal_volume = 0
+                state.false_buy_volume_ok = False
+                state.false_buy_reversal_volume_ok = False
 
         # === FALSE SELL: Check for reversal back below 4H high ===
-        if self.unified_state.false_sell_qualified and not self.unified_state.false_sell_reversal_detected:
-            if candle_5m.close < candle_4h.high:
-                self.unified_state.false_sell_reversal_detected = True
-                self.unified_state.false_sell_reversal_volume = candle_5m.volume
+        if state.false_sell_qualified and not state.false_sell_reversal_detected:
+            if close < high_4h:
+                state.false_sell_reversal_detected = True
+                state.false_sell_reversal_volume = volume
 
                 # Check reversal volume (tracked but not required)
-                reversal_volume_ok = self._check_unified_reversal_volume(candle_5m.volume)
-                self.unified_state.false_sell_reversal_volume_ok = reversal_volume_ok
-
-                vol_status = "✓" if reversal_volume_ok else "✗"
-                self.logger.info(f">>> FALSE SELL REVERSAL DETECTED (Rev Vol {vol_status}) <<<", self.symbol)
-                self.logger.info(f"5M Close: {candle_5m.close:.5f}", self.symbol)
-                self.logger.info(f"4H High: {candle_4h.high:.5f}", self.symbol)
-                self.logger.info(f"Reversal Volume: {candle_5m.volume}", self.symbol)
-                self.logger.info(f"Waiting for next candle to confirm reversal direction...", self.symbol)
+                reversal_volume_ok = self._check_unified_reversal_volume(volume, avg_volume)
+                state.false_sell_reversal_volume_ok = reversal_volume_ok
+
+                self.logger.info_lazy(
+                    self._REVERSAL_DETECTED_FMT,
+                    "FALSE SELL", "✓" if reversal_volume_ok else "✗",
+                    close, "4H High", high_4h, volume,
+                    symbol=self.symbol
+                )
 
         # === FALSE SELL: Check for confirmation candle after reversal ===
-        elif self.unified_state.false_sell_reversal_detected and not self.unified_state.false_sell_reversal_confirmed:
+        elif state.false_sell_reversal_detected and not state.false_sell_reversal_confirmed:
             # Confirmation: next candle continues in reversal direction (stays below 4H high)
-            if candle_5m.close < candle_4h.high:
-                self.unified_state.false_sell_reversal_confirmed = True
+            if close < high_4h:
+                state.false_sell_reversal_confirmed = True
 
-                self.logger.info(f">>> FALSE SELL REVERSAL CONFIRMED <<<", self.symbol)
-                self.logger.info(f"Confirmation Close: {candle_5m.close:.5f}", self.symbol)
-                self.logger.info(f"4H High: {candle_4h.high:.5f}", self.symbol)
-                self.logger.info("*** FALSE SELL SIGNAL GENERATED ***", self.symbol)
+                self.logger.info_lazy(
+                    self._REVERSAL_CONFIRMED_FMT,
+                    "FALSE SELL", close, "4H High", high_4h, "FALSE SELL",
+                    symbol=self.symbol
+                )
                 return self._generate_sell_signal(candle_4h, candle_5m)
             else:
                 # Reversal failed - price went back above 4H high
-                self.logger.info(f">>> FALSE SELL REVERSAL FAILED - Price back above 4H high <<<", self.symbol)
-                self.logger.info(f"Resetting false sell state...", self.symbol)
-                self.unified_state.false_sell_qualified = False
-                self.unified_state.false_sell_reversal_detected = False
-                self.unified_state.false_sell_reversal_volume = 0
-                self.unified_state.false_sell_volume_ok = False
-                self.unified_state.false_sell_reversal_volume_ok = False
+                self.logger.info_lazy(self._REVERSAL_FAILED_FMT, "FALSE SELL", "above 4H high", "false sell",
+                                      symbol=self.symbol)
+                state.false_sell_qualified = False
+                state.false_sell_reversal_detected = False
+                state.false_sell_reversal_volume = 0
+                state.false_sell_volume_ok = False
+                state.false_sell_reversal_volume_ok = False
 
         # === TRUE BUY: Check for retest and continuation above 4H high ===
-        if self.unified_state.true_buy_qualified and not self.unified_state.true_buy_continuation_detected:
+        if state.true_buy_qualified and not state.true_buy_continuation_detected:
             # First, check if we need to detect a retest
-            if not self.unified_state.true_buy_retest_detected:
+            if not state.true_buy_retest_detected:
                 # Retest: Price pulls back close to 4H high but stays above
                 # We consider it a retest if price comes within a small range of the breakout level
-                retest_range = candle_4h.high * 0.0005  # 0.05% range for retest detection
-                if candle_4h.high <= candle_5m.close <= (candle_4h.high + retest_range):
-                    self.unified_state.true_buy_retest_detected = True
-                    self.unified_state.true_buy_retest_ok = True
-                    self.logger.info(f">>> TRUE BUY RETEST DETECTED (Retest ✓) <<<", self.symbol)
-                    self.logger.info(f"5M Close: {candle_5m.close:.5f}", self.symbol)
-                    self.logger.info(f"4H High: {candle_4h.high:.5f}", self.symbol)
-                    self.logger.info(f"Retest Range: {retest_range:.5f}", self.symbol)
-                    self.logger.info("Waiting for continuation above 4H High...", self.symbol)
+                retest_range = candle_4h.retest_tol_high
+                if high_4h <= close <= (high_4h + retest_range):
+                    state.true_buy_retest_detected = True
+                    state.true_buy_retest_ok = True
+                    self.logger.info_lazy(
+                        self._RETEST_DETECTED_FMT,
+                        "TRUE BUY", close, "4H High", high_4h, retest_range,
+                        "Waiting for continuation above 4H High...",
+                        symbol=self.symbol
+                    )
 
             # After retest (or if retest not required), check for continuation
             # Only generate signal if retest occurred OR if price moved significantly above breakout
-            if self.unified_state.true_buy_retest_detected or candle_5m.close > (candle_4h.high * 1.001):
-                if candle_5m.close > candle_4h.high:
-                    self.unified_state.true_buy_continuation_detected = True
-                    self.unified_state.true_buy_continuation_volume = candle_5m.volume
+            if state.true_buy_retest_detected or close > candle_4h.continuation_high:
+                if close > high_4h:
+                    state.true_buy_continuation_detected = True
+                    state.true_buy_continuation_volume = volume
 
                     # Check continuation volume (tracked but not required)
-                    continuation_volume_ok = self._check_unified_continuation_volume(candle_5m.volume)
-                    self.unified_state.true_buy_continuation_volume_ok = continuation_volume_ok
-
-                    # Track retest status
-                    retest_status = "✓" if self.unified_state.true_buy_retest_ok else "✗"
-                    vol_status = "✓" if continuation_volume_ok else "✗"
-
-                    self.logger.info(f">>> TRUE BUY CONTINUATION DETECTED (Retest {retest_status}, Cont Vol {vol_status}) <<<", self.symbol)
-                    self.logger.info(f"5M Close: {candle_5m.close:.5f}", self.symbol)
-                    self.logger.info(f"4H High: {candle_4h.high:.5f}", self.symbol)
-                    self.logger.info(f"Continuation Volume: {candle_5m.volume}", self.symbol)
-
-                    # Always generate signal (confirmations tracked in signal)
-                    self.logger.info("*** TRUE BUY SIGNAL GENERATED ***", self.symbol)
+                    continuation_volume_ok = self._check_unified_continuation_volume(volume, avg_volume)
+                    state.true_buy_continuation_volume_ok = continuation_volume_ok
+
+                    # Track retest status; always generate signal (confirmations tracked in signal)
+                    self.logger.info_lazy(
+                        self._CONTINUATION_DETECTED_FMT,
+                        "TRUE BUY", "✓" if state.true_buy_retest_ok else "✗",
+                        "✓" if continuation_volume_ok else "✗",
+                        close, "4H High", high_4h, volume, "TRUE BUY",
+                        symbol=self.symbol
+                    )
                     return self._generate_true_buy_signal(candle_4h, candle_5m)
 
         # === TRUE SELL: Check for retest and continuation below 4H low ===
-        if self.unified_state.true_sell_qualified and not self.unified_state.true_sell_continuation_detected:
+        if state.true_sell_qualified and not state.true_sell_continuation_detected:
             # First, check if we need to detect a retest
-            if not self.unified_state.true_sell_retest_detected:
+            if not state.true_sell_retest_detected:
                 # Retest: Price pulls back close to 4H low but stays below
                 # We consider it a retest if price comes within a small range of the breakout level
-                retest_range = candle_4h.low * 0.0005  # 0.05% range for retest detection
-                if (candle_4h.low - retest_range) <= candle_5m.close <= candle_4h.low:
-                    self.unified_state.true_sell_retest_detected = True
-                    self.unified_state.true_sell_retest_ok = True
-                    self.logger.info(f">>> TRUE SELL RETEST DETECTED (Retest ✓) <<<", self.symbol)
-                    self.logger.info(f"5M Close: {candle_5m.close:.5f}", self.symbol)
-                    self.logger.info(f"4H Low: {candle_4h.low:.5f}", self.symbol)
-                    self.logger.info(f"Retest Range: {retest_range:.5f}", self.symbol)
-                    self.logger.info("Waiting for continuation below 4H Low...", self.symbol)
+                retest_range = candle_4h.retest_tol_low
+                if (low_4h - retest_range) <= close <= low_4h:
+                    state.true_sell_retest_detected = True
+                    state.true_sell_retest_ok = True
+                    self.logger.info_lazy(
+                        self._RETEST_DETECTED_FMT,
+                        "TRUE SELL", close, "4H Low", low_4h, retest_range,
+                        "Waiting for continuation below 4H Low...",
+                        symbol=self.symbol
+                    )
 
             # After retest (or if retest not required), check for continuation
             # Only generate signal if retest occurred OR if price moved significantly below breakout
-            if self.unified_state.true_sell_retest_detected or candle_5m.close < (candle_4h.low * 0.999):
-                if candle_5m.close < candle_4h.low:
-                    self.unified_state.true_sell_continuation_detected = True
-                    self.unified_state.true_sell_continuation_volume = candle_5m.volume
+            if state.true_sell_retest_detected or close < candle_4h.continuation_low:
+                if close < low_4h:
+                    state.true_sell_continuation_detected = True
+                    state.true_sell_continuation_volume = volume
 
                     # Check continuation volume (tracked but not required)
-                    continuation_volume_ok = self._check_unified_continuation_volume(candle_5m.volume)
-                    self.unified_state.true_sell_continuation_volume_ok = continuation_volume_ok
-
-                    # Track retest status
-                    retest_status = "✓" if self.unified_state.true_sell_retest_ok else "✗"
-                    vol_status = "✓" if continuation_volume_ok else "✗"
-
-                    self.logger.info(f">>> TRUE SELL CONTINUATION DETECTED (Retest {retest_status}, Cont Vol {vol_status}) <<<", self.symbol)
-                    self.logger.info(f"5M Close: {candle_5m.close:.5f}", self.symbol)
-                    self.logger.info(f"4H Low: {candle_4h.low:.5f}", self.symbol)
-                    self.logger.info(f"Continuation Volume: {candle_5m.volume}", self.symbol)
-
-                    # Always generate signal (confirmations tracked in signal)
-                    self.logger.info("*** TRUE SELL SIGNAL GENERATED ***", self.symbol)
+                    continuation_volume_ok = self._check_unified_continuation_volume(volume, avg_volume)
+                    state.true_sell_continuation_volume_ok = continuation_volume_ok
+
+                    # Track retest status; always generate signal (confirmations tracked in signal)
+                    self.logger.info_lazy(
+                        self._CONTINUATION_DETECTED_FMT,
+                        "TRUE SELL", "✓" if state.true_sell_retest_ok else "✗",
+                        "✓" if continuation_volume_ok else "✗",
+                        close, "4H Low", low_4h, volume, "TRUE SELL",
+                        symbol=self.symbol
+                    )
                     return self._generate_true_sell_signal(candle_4h, candle_5m)
 
         return None
 
-    def _check_unified_reversal_volume(self, volume: int) -> bool:
-        """Check if reversal volume is HIGH (for FALSE BREAKOUT)"""
-        df = self.candle_processor.get_5m_candles(count=100)
-        if df is None:
+    def _check_unified_reversal_volume(self, volume: int, avg_volume: Optional[float]) -> bool:
+        """Check if reversal volume is HIGH (for FALSE BREAKOUT) against this check's average volume"""
+        if avg_volume is None:
             return False
 
-        avg_volume = self.indicators.calculate_average_volume(
-            df['tick_volume'],
-            self.symbol_params.volume_average_period
-        )
-
         return self.indicators.is_reversal_volume_high(
             volume, avg_volume,
             self.symbol_params.reversal_volume_min,
             self.symbol
         )
 
-    def _check_unified_continuation_volume(self, volume: int) -> bool:
-        """Check if continuation volume is HIGH (for TRUE BREAKOUT)"""
-        df = self.candle_processor.get_5m_candles(count=100)
-        if df is None:
+    def _check_unified_continuation_volume(self, volume: int, avg_volume: Optional[float]) -> bool:
+        """Check if continuation volume is HIGH (for TRUE BREAKOUT) against this check's average volume"""
+        if avg_volume is None:
             return False
 
-        avg_volume = self.indicators.calculate_average_volume(
-            df['tick_volume'],
-            self.symbol_params.volume_average_period
-        )
-
         return self.indicators.is_continuation_volume_high(
             volume, avg_volume,
             self.symbol_params.continuation_volume_min,
@@ -875,9 +1017,10 @@ class StrategyEngine:
             self.symbol
         )
     
-    def _check_buy_divergence(self) -> bool:
-        """Check for bullish divergence"""
-        df = self.candle_processor.get_5m_candles(count=100)
+    def _check_buy_divergence(self, df: Optional[pd.DataFrame] = None) -> bool:
+        """Check for bullish divergence (df: recent 5M candles, fetched if not given)"""
+        if df is None:
+            df = self.candle_processor.get_5m_candles(count=100)
         if df is None:
             return False
 
@@ -888,9 +1031,10 @@ class StrategyEngine:
             self.symbol
         )
 
-    def _check_sell_divergence(self) -> bool:
-        """Check for bearish divergence"""
-        df = self.candle_processor.get_5m_candles(count=100)
+    def _check_sell_divergence(self, df: Optional[pd.DataFrame] = None) -> bool:
+        """Check for bearish divergence (df: recent 5M candles, fetched if not given)"""
+        if df is None:
+            df = self.candle_processor.get_5m_candles(count=100)
         if df is None:
             return False
 
@@ -1141,7 +1285,7 @@ class StrategyEngine:
                 return False
         return True
 
-    def _calculate_sl_offset(self, reference_price: float) -> float:
+    def _calculate_sl_offset(self, reference_price: float, symbol_info: Optional[dict] = None) -> float:
         """
         Calculate stop loss offset based on configuration.
 
@@ -1150,20 +1294,22 @@ class StrategyEngine:
 
         Args:
             reference_price: The reference price (lowest_low for BUY, highest_high for SELL)
+            symbol_info: Symbol info already fetched by the caller (optional)
 
         Returns:
             Stop loss offset in price units
         """
-        if self.strategy_config.use_point_based_sl and self.connector is not None:
+        if self._use_point_sl and self.connector is not None:
             # Point-based calculation (recommended)
-            symbol_info = self.connector.get_symbol_info(self.symbol)
+            if symbol_info is None:
+                symbol_info = self.connector.get_symbol_info(self.symbol)
             if symbol_info is not None:
                 point = symbol_info['point']
                 # Convert points to price offset
-                sl_offset = self.strategy_config.stop_loss_offset_points * point
+                sl_offset = self._sl_points * point
 
                 self.logger.debug(
-                    f"SL offset (point-based): {self.strategy_config.stop_loss_offset_points} points = {sl_offset:.5f}",
+                    f"SL offset (point-based): {self._sl_points} points = {sl_offset:.5f}",
                     self.symbol
                 )
                 return sl_offset
@@ -1174,366 +1320,149 @@ class StrategyEngine:
                 )
 
         # Percentage-based calculation (legacy/fallback)
-        sl_offset = reference_price * (self.strategy_config.stop_loss_offset_percent / 100.0)
+        sl_offset = reference_price * (self._sl_percent / 100.0)
         self.logger.debug(
-            f"SL offset (percentage-based): {self.strategy_config.stop_loss_offset_percent}% = {sl_offset:.5f}",
+            f"SL offset (percentage-based): {self._sl_percent}% = {sl_offset:.5f}",
             self.symbol
         )
         return sl_offset
 
-    def _generate_buy_signal(self, candle_4h: FourHourCandle,
-                            candle_5m: CandleData) -> TradeSignal:
+    def _get_spread_price(self, symbol_info: Optional[dict], label: str) -> float:
         """
-        Generate BUY trade signal.
+        Get the current spread in price units, used to widen the stop loss.
 
         Args:
-            candle_4h: 4H candle
-            candle_5m: Latest 5M candle
+            symbol_info: Symbol info already fetched by the caller (None skips the spread)
+            label: Signal label for the debug log (e.g. "BUY", "TRUE SELL")
 
         Returns:
-            TradeSignal for BUY
+            Spread in price units (0.0 if unavailable)
         """
-        # Find the LOWEST LOW among the last 10 candles that closed BELOW 4H low
-        # This matches MQL5: FindLowestLowInRange()
-        lowest_low = self._find_lowest_low_in_pattern(candle_4h.low)
-
-        if lowest_low is None:
-            self.logger.warning("No valid lowest low found for BUY signal", self.symbol)
-            lowest_low = candle_4h.low  # Fallback to 4H low
-
-        # Entry: Will use current ASK price at execution (matches MQL5)
-        # For signal generation, use current 5M close as reference
-        entry_price = candle_5m.close
-
-        # Stop Loss: Below the LOWEST LOW (not 4H low!)
-        # Use point-based or percentage-based calculation
-        sl_offset = self._calculate_sl_offset(lowest_low)
-
-        # Add spread to SL to account for bid-ask spread
-        # For BUY: Entry at ASK, SL triggered when BID hits SL
-        # So we need to widen SL by spread amount
-        spread_price = 0.0
-        if self.connector is not None:
-            symbol_info = self.connector.get_symbol_info(self.symbol)
-            if symbol_info is not None:
-                spread_points = self.connector.get_spread(self.symbol)
-                if spread_points is not None:
-                    point = symbol_info['point']
-                    spread_price = spread_points * point
-                    self.logger.debug(
-                        f"Adding spread to BUY SL: {spread_points:.1f} points = {spread_price:.5f}",
-                        self.symbol
-                    )
-
-        stop_loss = lowest_low - sl_offset - spread_price
-
-        # Take Profit: Based on R:R ratio
-        # Note: TP will be recalculated in order_manager using actual execution price
-        risk = entry_price - stop_loss
-        reward = risk * self.strategy_config.risk_reward_ratio
-        take_profit = entry_price + reward
-
-        # Track confirmations from unified state (always checked, not required)
-        # Volume confirmed = both breakout volume LOW and reversal volume HIGH
-        volume_confirmed = (self.unified_state.false_buy_volume_ok and
-                          self.unified_state.false_buy_reversal_volume_ok)
-
-        # Divergence confirmed = divergence was present at breakout
-        divergence_confirmed = self.unified_state.false_buy_divergence_ok
-
-        signal = TradeSignal(
-            symbol=self.symbol,
-            signal_type=PositionType.BUY,
-            entry_price=entry_price,
-            stop_loss=stop_loss,
-            take_profit=take_profit,
-            lot_size=0.0,  # Will be calculated by risk manager
-            timestamp=candle_5m.time,
-            reason="False breakout below 4H low with reversal",
-            max_spread_percent=self.symbol_params.max_spread_percent,
-            volume_confirmed=volume_confirmed,
-            divergence_confirmed=divergence_confirmed
+        if symbol_info is None:
+            return 0.0
+        spread_points = self.connector.get_spread(self.symbol)
+        if spread_points is None:
+            return 0.0
+        spread_price = spread_points * symbol_info['point']
+        self.logger.debug(
+            f"Adding spread to {label} SL: {spread_points:.1f} points = {spread_price:.5f}",
+            self.symbol
         )
+        return spread_price
 
-        self.logger.info("=" * 60, self.symbol)
-        self.logger.info("*** BUY SIGNAL GENERATED ***", self.symbol)
-        self.logger.info(f"4H Low: {candle_4h.low:.5f}", self.symbol)
-        self.logger.info(f"Lowest Low in Pattern: {lowest_low:.5f}", self.symbol)
-        self.logger.info(f"SL Offset: {sl_offset:.5f}", self.symbol)
-        if spread_price > 0:
-            self.logger.info(f"Spread Adjustment: {spread_price:.5f}", self.symbol)
-        self.logger.info(f"Entry (reference): {entry_price:.5f} (actual entry will be current ASK)", self.symbol)
-        self.logger.info(f"Stop Loss: {stop_loss:.5f} (includes spread adjustment)", self.symbol)
-        self.logger.info(f"Take Profit (reference): {take_profit:.5f} (will be recalculated at execution)", self.symbol)
-        self.logger.info(f"Risk (estimated): {risk:.5f}", self.symbol)
-        self.logger.info(f"Reward (estimated): {reward:.5f}", self.symbol)
-        self.logger.info(f"R:R Ratio: 1:{self.strategy_config.risk_reward_ratio}", self.symbol)
-        self.logger.info("=" * 60, self.symbol)
-
-        return signal
+    def _generate_buy_signal(self, candle_4h: FourHourCandle,
+                            candle_5m: CandleData) -> TradeSignal:
+        """Generate FALSE BUY trade signal (see _generate_signal)."""
+        return self._generate_signal(_FALSE_BUY_SIGNAL, candle_4h, candle_5m)
 
     def _generate_sell_signal(self, candle_4h: FourHourCandle,
                              candle_5m: CandleData) -> TradeSignal:
-        """
-        Generate SELL trade signal.
-
-        Args:
-            candle_4h: 4H candle
-            candle_5m: Latest 5M candle
-
-        Returns:
-            TradeSignal for SELL
-        """
-        # Find the HIGHEST HIGH among the last 10 candles that closed ABOVE 4H high
-        # This matches MQL5: FindHighestHighInRange()
-        highest_high = self._find_highest_high_in_pattern(candle_4h.high)
-
-        if highest_high is None:
-            self.logger.warning("No valid highest high found for SELL signal", self.symbol)
-            highest_high = candle_4h.high  # Fallback to 4H high
-
-        # Entry: Will use current BID price at execution (matches MQL5)
-        # For signal generation, use current 5M close as reference
-        entry_price = candle_5m.close
-
-        # Stop Loss: Above the HIGHEST HIGH (not 4H high!)
-        # Use point-based or percentage-based calculation
-        sl_offset = self._calculate_sl_offset(highest_high)
-
-        # Add spread to SL to account for bid-ask spread
-        # For SELL: Entry at BID, SL triggered when ASK hits SL
-        # So we need to widen SL by spread amount
-        spread_price = 0.0
-        if self.connector is not None:
-            symbol_info = self.connector.get_symbol_info(self.symbol)
-            if symbol_info is not None:
-                spread_points = self.connector.get_spread(self.symbol)
-                if spread_points is not None:
-                    point = symbol_info['point']
-                    spread_price = spread_points * point
-                    self.logger.debug(
-                        f"Adding spread to SELL SL: {spread_points:.1f} points = {spread_price:.5f}",
-                        self.symbol
-                    )
-
-        stop_loss = highest_high + sl_offset + spread_price
-
-        # Take Profit: Based on R:R ratio
-        # Note: TP will be recalculated in order_manager using actual execution price
-        risk = stop_loss - entry_price
-        reward = risk * self.strategy_config.risk_reward_ratio
-        take_profit = entry_price - reward
-
-        # Track confirmations from unified state (always checked, not required)
-        # Volume confirmed = both breakout volume LOW and reversal volume HIGH
-        volume_confirmed = (self.unified_state.false_sell_volume_ok and
-                          self.unified_state.false_sell_reversal_volume_ok)
-
-        # Divergence confirmed = divergence was present at breakout
-        divergence_confirmed = self.unified_state.false_sell_divergence_ok
-
-        signal = TradeSignal(
-            symbol=self.symbol,
-            signal_type=PositionType.SELL,
-            entry_price=entry_price,
-            stop_loss=stop_loss,
-            take_profit=take_profit,
-            lot_size=0.0,  # Will be calculated by risk manager
-            timestamp=candle_5m.time,
-            reason="False breakout above 4H high with reversal",
-            max_spread_percent=self.symbol_params.max_spread_percent,
-            volume_confirmed=volume_confirmed,
-            divergence_confirmed=divergence_confirmed
-        )
-
-        self.logger.info("=" * 60, self.symbol)
-        self.logger.info("*** SELL SIGNAL GENERATED ***", self.symbol)
-        self.logger.info(f"4H High: {candle_4h.high:.5f}", self.symbol)
-        self.logger.info(f"Highest High in Pattern: {highest_high:.5f}", self.symbol)
-        self.logger.info(f"SL Offset: {sl_offset:.5f}", self.symbol)
-        if spread_price > 0:
-            self.logger.info(f"Spread Adjustment: {spread_price:.5f}", self.symbol)
-        self.logger.info(f"Entry (reference): {entry_price:.5f} (actual entry will be current BID)", self.symbol)
-        self.logger.info(f"Stop Loss: {stop_loss:.5f} (includes spread adjustment)", self.symbol)
-        self.logger.info(f"Take Profit (reference): {take_profit:.5f} (will be recalculated at execution)", self.symbol)
-        self.logger.info(f"Risk (estimated): {risk:.5f}", self.symbol)
-        self.logger.info(f"Reward (estimated): {reward:.5f}", self.symbol)
-        self.logger.info(f"R:R Ratio: 1:{self.strategy_config.risk_reward_ratio}", self.symbol)
-        self.logger.info("=" * 60, self.symbol)
-
-        return signal
+        """Generate FALSE SELL trade signal (see _generate_signal)."""
+        return self._generate_signal(_FALSE_SELL_SIGNAL, candle_4h, candle_5m)
 
     def _generate_true_buy_signal(self, candle_4h: FourHourCandle,
                                   candle_5m: CandleData) -> TradeSignal:
-        """
-        Generate TRUE BUY trade signal (continuation upward).
-
-        Args:
-            candle_4h: 4H candle
-            candle_5m: Latest 5M candle
-
-        Returns:
-            TradeSignal for TRUE BUY
-        """
-        # Find the LOWEST LOW among the last 10 candles that closed BELOW 4H low
-        # This matches the FALSE BUY strategy and MQL5: FindLowestLowInRange()
-        lowest_low = self._find_lowest_low_in_pattern(candle_4h.low)
-
-        if lowest_low is None:
-            self.logger.warning("No valid lowest low found for TRUE BUY signal", self.symbol)
-            lowest_low = candle_4h.low  # Fallback to 4H low
-
-        # Entry: Will use current ASK price at execution
-        entry_price = candle_5m.close
-
-        # Stop Loss: Below the LOWEST LOW (same as FALSE BUY strategy)
-        # Use point-based or percentage-based calculation
-        sl_offset = self._calculate_sl_offset(lowest_low)
-
-        # Add spread to SL to account for bid-ask spread
-        # For BUY: Entry at ASK, SL triggered when BID hits SL
-        # So we need to widen SL by spread amount
-        spread_price = 0.0
-        if self.connector is not None:
-            symbol_info = self.connector.get_symbol_info(self.symbol)
-            if symbol_info is not None:
-                spread_points = self.connector.get_spread(self.symbol)
-                if spread_points is not None:
-                    point = symbol_info['point']
-                    spread_price = spread_points * point
-                    self.logger.debug(
-                        f"Adding spread to TRUE BUY SL: {spread_points:.1f} points = {spread_price:.5f}",
-                        self.symbol
-                    )
-
-        stop_loss = lowest_low - sl_offset - spread_price
-
-        # Take Profit: Based on R:R ratio
-        risk = entry_price - stop_loss
-        reward = risk * self.strategy_config.risk_reward_ratio
-        take_profit = entry_price + reward
-
-        # Track confirmations from unified state (always checked, not required)
-        # Volume confirmed = breakout volume HIGH + retest occurred + continuation volume HIGH
-        volume_confirmed = (self.unified_state.true_buy_volume_ok and
-                          self.unified_state.true_buy_retest_ok and
-                          self.unified_state.true_buy_continuation_volume_ok)
-
-        signal = TradeSignal(
-            symbol=self.symbol,
-            signal_type=PositionType.BUY,
-            entry_price=entry_price,
-            stop_loss=stop_loss,
-            take_profit=take_profit,
-            lot_size=0.0,  # Will be calculated by risk manager
-            timestamp=candle_5m.time,
-            reason="True breakout above 4H high with continuation",
-            max_spread_percent=self.symbol_params.max_spread_percent,
-            is_true_breakout=True,
-            volume_confirmed=volume_confirmed,
-            divergence_confirmed=False  # Not used for true breakouts
-        )
-
-        self.logger.info("=" * 60, self.symbol)
-        self.logger.info("*** TRUE BUY SIGNAL GENERATED ***", self.symbol)
-        self.logger.info(f"4H High (breakout level): {candle_4h.high:.5f}", self.symbol)
-        self.logger.info(f"SL Offset: {sl_offset:.5f}", self.symbol)
-        if spread_price > 0:
-            self.logger.info(f"Spread Adjustment: {spread_price:.5f}", self.symbol)
-        self.logger.info(f"Entry (reference): {entry_price:.5f} (actual entry will be current ASK)", self.symbol)
-        self.logger.info(f"Stop Loss: {stop_loss:.5f} (below 4H high)", self.symbol)
-        self.logger.info(f"Take Profit (reference): {take_profit:.5f}", self.symbol)
-        self.logger.info(f"Risk (estimated): {risk:.5f}", self.symbol)
-        self.logger.info(f"Reward (estimated): {reward:.5f}", self.symbol)
-        self.logger.info(f"R:R Ratio: 1:{self.strategy_config.risk_reward_ratio}", self.symbol)
-        self.logger.info("=" * 60, self.symbol)
-
-        return signal
+        """Generate TRUE BUY trade signal (see _generate_signal)."""
+        return self._generate_signal(_TRUE_BUY_SIGNAL, candle_4h, candle_5m)
 
     def _generate_true_sell_signal(self, candle_4h: FourHourCandle,
                                    candle_5m: CandleData) -> TradeSignal:
+        """Generate TRUE SELL trade signal (see _generate_signal)."""
+        return self._generate_signal(_TRUE_SELL_SIGNAL, candle_4h, candle_5m)
+
+    def _generate_signal(self, side: _SignalSide, candle_4h: FourHourCandle,
+                         candle_5m: CandleData) -> TradeSignal:
         """
-        Generate TRUE SELL trade signal (continuation downward).
+        Generate a FALSE or TRUE breakout trade signal.
 
         Args:
+            side: Signal kind and direction (_FALSE_BUY_SIGNAL, _TRUE_SELL_SIGNAL, ...)
             candle_4h: 4H candle
             candle_5m: Latest 5M candle
 
         Returns:
-            TradeSignal for TRUE SELL
+            TradeSignal for the given side
         """
-        # Find the HIGHEST HIGH among the last 10 candles that closed ABOVE 4H high
-        # This matches the FALSE SELL strategy and MQL5: FindHighestHighInRange()
-        highest_high = self._find_highest_high_in_pattern(candle_4h.high)
+        # BUY: find the LOWEST LOW among the last 10 candles that closed BELOW 4H low
+        # SELL: find the HIGHEST HIGH among the last 10 candles that closed ABOVE 4H high
+        # This matches MQL5: FindLowestLowInRange() / FindHighestHighInRange()
+        if side.direction > 0:
+            extreme = self._find_lowest_low_in_pattern(candle_4h.low)
+            fallback = candle_4h.low
+        else:
+            extreme = self._find_highest_high_in_pattern(candle_4h.high)
+            fallback = candle_4h.high
 
-        if highest_high is None:
-            self.logger.warning("No valid highest high found for TRUE SELL signal", self.symbol)
-            highest_high = candle_4h.high  # Fallback to 4H high
+        if extreme is None:
+            self.logger.warning(f"No valid {side.extreme_label} found for {side.label} signal", self.symbol)
+            extreme = fallback  # Fallback to 4H low (BUY) / 4H high (SELL)
 
-        # Entry: Will use current BID price at execution
+        # Entry: Will use current ASK (BUY) / BID (SELL) price at execution (matches MQL5)
+        # For signal generation, use current 5M close as reference
         entry_price = candle_5m.close
 
-        # Stop Loss: Above the HIGHEST HIGH (same as FALSE SELL strategy)
+        # Stop Loss: Beyond the pattern extreme (not the 4H level!)
         # Use point-based or percentage-based calculation
-        sl_offset = self._calculate_sl_offset(highest_high)
+        # Symbol info is shared by the SL offset and spread calculations
+        symbol_info = self.connector.get_symbol_info(self.symbol) if self.connector is not None else None
+        sl_offset = self._calculate_sl_offset(extreme, symbol_info)
 
         # Add spread to SL to account for bid-ask spread
-        # For SELL: Entry at BID, SL triggered when ASK hits SL
+        # BUY: Entry at ASK, SL triggered when BID hits SL (and vice versa for SELL)
         # So we need to widen SL by spread amount
-        spread_price = 0.0
-        if self.connector is not None:
-            symbol_info = self.connector.get_symbol_info(self.symbol)
-            if symbol_info is not None:
-                spread_points = self.connector.get_spread(self.symbol)
-                if spread_points is not None:
-                    point = symbol_info['point']
-                    spread_price = spread_points * point
-                    self.logger.debug(
-                        f"Adding spread to TRUE SELL SL: {spread_points:.1f} points = {spread_price:.5f}",
-                        self.symbol
-                    )
+        spread_price = self._get_spread_price(symbol_info, side.label)
 
-        stop_loss = highest_high + sl_offset + spread_price
+        # Widen away from entry: below for BUY, above for SELL
+        stop_loss = extreme - side.direction * sl_offset - side.direction * spread_price
 
         # Take Profit: Based on R:R ratio
-        risk = stop_loss - entry_price
-        reward = risk * self.strategy_config.risk_reward_ratio
-        take_profit = entry_price - reward
+        # Note: TP will be recalculated in order_manager using actual execution price
+        risk = side.direction * (entry_price - stop_loss)
+        reward = risk * self._rr
+        take_profit = entry_price + side.direction * reward
 
         # Track confirmations from unified state (always checked, not required)
-        # Volume confirmed = breakout volume HIGH + retest occurred + continuation volume HIGH
-        volume_confirmed = (self.unified_state.true_sell_volume_ok and
-                          self.unified_state.true_sell_retest_ok and
-                          self.unified_state.true_sell_continuation_volume_ok)
+        volume_confirmed, divergence_confirmed = side.confirmations(self.unified_state)
 
         signal = TradeSignal(
             symbol=self.symbol,
-            signal_type=PositionType.SELL,
+            signal_type=side.position_type,
             entry_price=entry_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             lot_size=0.0,  # Will be calculated by risk manager
             timestamp=candle_5m.time,
-            reason="True breakout below 4H low with continuation",
-            max_spread_percent=self.symbol_params.max_spread_percent,
-            is_true_breakout=True,
+            reason=side.reason,
+            max_spread_percent=self._max_spread,
+            is_true_breakout=side.is_true_breakout,
             volume_confirmed=volume_confirmed,
-            divergence_confirmed=False  # Not used for true breakouts
+            divergence_confirmed=divergence_confirmed
         )
 
-        self.logger.info("=" * 60, self.symbol)
-        self.logger.info("*** TRUE SELL SIGNAL GENERATED ***", self.symbol)
-        self.logger.info(f"4H Low (breakout level): {candle_4h.low:.5f}", self.symbol)
-        self.logger.info(f"SL Offset: {sl_offset:.5f}", self.symbol)
-        if spread_price > 0:
-            self.logger.info(f"Spread Adjustment: {spread_price:.5f}", self.symbol)
-        self.logger.info(f"Entry (reference): {entry_price:.5f} (actual entry will be current BID)", self.symbol)
-        self.logger.info(f"Stop Loss: {stop_loss:.5f} (above 4H low)", self.symbol)
-        self.logger.info(f"Take Profit (reference): {take_profit:.5f}", self.symbol)
-        self.logger.info(f"Risk (estimated): {risk:.5f}", self.symbol)
-        self.logger.info(f"Reward (estimated): {reward:.5f}", self.symbol)
-        self.logger.info(f"R:R Ratio: 1:{self.strategy_config.risk_reward_ratio}", self.symbol)
-        self.logger.info("=" * 60, self.symbol)
+        # Signal summary, logged as a single record
+        if self.logger.isEnabledFor(logging.INFO, self.symbol):
+            level = candle_4h.high if side.level_is_high else candle_4h.low
+            lines = [
+                self._SEP,
+                f"*** {side.label} SIGNAL GENERATED ***",
+                f"{side.level_label}: {level:.5f}",
+            ]
+            if side.pattern_label:
+                lines.append(f"{side.pattern_label}: {extreme:.5f}")
+            lines.append(f"SL Offset: {sl_offset:.5f}")
+            if spread_price > 0:
+                lines.append(f"Spread Adjustment: {spread_price:.5f}")
+            entry_quote = "ASK" if side.direction > 0 else "BID"
+            lines += [
+                f"Entry (reference): {entry_price:.5f} (actual entry will be current {entry_quote})",
+                f"Stop Loss: {stop_loss:.5f} ({side.stop_loss_note})",
+                f"Take Profit (reference): {take_profit:.5f}{side.take_profit_note}",
+                f"Risk (estimated): {risk:.5f}",
+                f"Reward (estimated): {reward:.5f}",
+                f"R:R Ratio: 1:{self._rr}",
+                self._SEP,
+            ]
+            self.logger.info("\n".join(lines), self.symbol)
 
         return signal
 
@@ -1548,25 +1477,20 @@ class StrategyEngine:
         Returns:
             Lowest low price, or None if no valid candles found
         """
-        # Get last 10 5M candles
-        df = self.candle_processor.get_5m_candles(count=10)
+        # Last 10 5M candles, taken from the check's shared 100-candle frame
+        df = self.candle_processor.get_5m_candles(count=100)
         if df is None or len(df) == 0:
             return None
+        closes = df['close'].to_numpy()[-10:]
+        lows = df['low'].to_numpy()[-10:]
 
-        lowest_low = None
-
-        # Find candles that closed BELOW 4H low
-        for idx in range(len(df)):
-            candle_close = df.iloc[idx]['close']
-            candle_low = df.iloc[idx]['low']
-
-            # Only consider candles that closed BELOW 4H low
-            if candle_close < four_h_low:
-                if lowest_low is None or candle_low < lowest_low:
-                    lowest_low = candle_low
+        # Only consider candles that closed BELOW 4H low
+        pattern_lows = lows[closes < four_h_low]
+        if len(pattern_lows) == 0:
+            return None
+        lowest_low = float(pattern_lows.min())
 
-        if lowest_low is not None:
-            self.logger.info(f"Found lowest low in pattern: {lowest_low:.5f} (4H low: {four_h_low:.5f})", self.symbol)
+        self.logger.info(f"Found lowest low in pattern: {lowest_low:.5f} (4H low: {four_h_low:.5f})", self.symbol)
 
         return lowest_low
 
@@ -1581,25 +1505,20 @@ class StrategyEngine:
         Returns:
             Highest high price, or None if no valid candles found
         """
-        # Get last 10 5M candles
-        df = self.candle_processor.get_5m_candles(count=10)
+        # Last 10 5M candles, taken from the check's shared 100-candle frame
+        df = self.candle_processor.get_5m_candles(count=100)
         if df is None or len(df) == 0:
             return None
+        closes = df['close'].to_numpy()[-10:]
+        highs = df['high'].to_numpy()[-10:]
 
-        highest_high = None
-
-        # Find candles that closed ABOVE 4H high
-        for idx in range(len(df)):
-            candle_close = df.iloc[idx]['close']
-            candle_high = df.iloc[idx]['high']
-
-            # Only consider candles that closed ABOVE 4H high
-            if candle_close > four_h_high:
-                if highest_high is None or candle_high > highest_high:
-                    highest_high = candle_high
+        # Only consider candles that closed ABOVE 4H high
+        pattern_highs = highs[closes > four_h_high]
+        if len(pattern_highs) == 0:
+            return None
+        highest_high = float(pattern_highs.max())
 
-        if highest_high is not None:
-            self.logger.info(f"Found highest high in pattern: {highest_high:.5f} (4H high: {four_h_high:.5f})", self.symbol)
+        self.logger.info(f"Found highest high in pattern: {highest_high:.5f} (4H high: {four_h_high:.5f})", self.symbol)
 
         return highest_high
 
@@ -54,7 +54,7 @@ class TradingLogger:
 
     def __init__(self, name: str = "TradingBot", log_to_file: bool = True,
                  log_to_console: bool = True, log_level: str = "INFO",
-                 enable_detailed: bool = True):
+                 enable_detailed: bool = True, symbol_log_level: str = "DEBUG"):
         """
         Initialize the trading logger.
 
@@ -64,12 +64,14 @@ class TradingLogger:
             log_to_console: Enable console logging
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             enable_detailed: Enable detailed logging
+            symbol_log_level: Minimum level written to symbol-specific log files
         """
         self.logger = logging.getLogger(name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
         self.logger.handlers.clear()  # Clear existing handlers
 
         self.enable_detailed = enable_detailed
+        self.symbol_log_level = getattr(logging, symbol_log_level.upper())
         self.log_dir = Path("logs")
         self.symbol_handlers: Dict[str, logging.FileHandler] = {}
         self.disable_log_handler: Optional[logging.FileHandler] = None
@@ -158,7 +160,7 @@ class TradingLogger:
             log_file = date_dir / f"{symbol}.log"
 
             handler = logging.FileHandler(log_file, encoding='utf-8')
-            handler.setLevel(logging.DEBUG)
+            handler.setLevel(self.symbol_log_level)
 
             # Use UTC formatter
             formatter = UTCFormatter(
@@ -184,6 +186,8 @@ class TradingLogger:
             message: Log message
             symbol: Trading symbol
         """
+        if level < self.symbol_log_level:
+            return
         handler = self._get_symbol_handler(symbol)
         if handler:
             # Create a log record
@@ -198,6 +202,27 @@ class TradingLogger:
             )
             handler.emit(record)
 
+    def isEnabledFor(self, level: int, symbol: Optional[str] = None) -> bool:
+        """
+        Check if a message at the given level would be emitted.
+
+        Mirrors logging.Logger.isEnabledFor so callers can skip building
+        expensive messages. Symbol messages go to both the symbol-specific
+        file and the master log, so they are enabled if either level allows them.
+
+        Args:
+            level: Logging level (e.g., logging.DEBUG)
+            symbol: Symbol the message would be logged for (optional)
+
+        Returns:
+            True if the message would be written to at least one handler
+        """
+        if level <= logging.DEBUG and not self.enable_detailed:
+            return False
+        if symbol and level >= self.symbol_log_level:
+            return True
+        return self.logger.isEnabledFor(level)
+
     def info(self, message: str, symbol: Optional[str] = None):
         """Log info message"""
         if symbol:
@@ -207,6 +232,21 @@ class TradingLogger:
             message = f"[{symbol}] {message}"
         self.logger.info(message)
 
+    def info_lazy(self, fmt: str, *args, symbol: Optional[str] = None):
+        """
+        Log info message, applying the %-style formatting only if INFO is enabled.
+
+        Nothing is formatted when both the master log level and the symbol
+        log level (for symbol messages) are above INFO.
+
+        Args:
+            fmt: %-style format string
+            *args: Format arguments
+            symbol: Symbol name (optional)
+        """
+        if self.isEnabledFor(logging.INFO, symbol):
+            self.info(fmt % args if args else fmt, symbol)
+
     def debug(self, message: str, symbol: Optional[str] = None):
         """Log debug message (only if detailed logging enabled)"""
         if self.enable_detailed:
@@ -550,20 +590,23 @@ def get_logger() -> TradingLogger:
             log_to_file=config.logging.log_to_file,
             log_to_console=config.logging.log_to_console,
             log_level=config.logging.log_level,
-            enable_detailed=config.logging.enable_detailed_logging
+            enable_detailed=config.logging.enable_detailed_logging,
+            symbol_log_level=config.logging.symbol_log_level
         )
     return _logger
 
 
 def init_logger(log_to_file: bool = True, log_to_console: bool = True,
-                log_level: str = "INFO", enable_detailed: bool = True) -> TradingLogger:
+                log_level: str = "INFO", enable_detailed: bool = True,
+                symbol_log_level: str = "DEBUG") -> TradingLogger:
     """Initialize the global logger"""
     global _logger
     _logger = TradingLogger(
         log_to_file=log_to_file,
         log_to_console=log_to_console,
         log_level=log_level,
-        enable_detailed=enable_detailed
+        enable_detailed=enable_detailed,
+        symbol_log_level=symbol_log_level
     )
     return _logger
 
@@ -8,10 +8,11 @@ Tests that:
 3. Both ranges can generate signals simultaneously for the same symbol
 4. Range identifiers are properly tracked in trade signals
 """
+import sys
 from datetime import datetime, timezone, time as dt_time
 from src.models.data_models import (
     RangeConfig, MultiRangeBreakoutState, ReferenceCandle, CandleData,
-    PositionType
+    PositionType, TradeSignal
 )
 
 
@@ -188,6 +189,112 @@ def test_range_reset():
     print()
 
 
+def test_strategy_qualification_tracking():
+    """Test that qualification is tracked per range and cleared on reset"""
+    print("=" * 70)
+    print("TEST 5: Strategy Qualification Tracking")
+    print("=" * 70)
+    
+    state = MultiRangeBreakoutState()
+    state_4h = state.get_or_create_state("4H_5M")
+    state_15m = state.get_or_create_state("15M_1M")
+    
+    # No breakout yet - nothing to classify or confirm
+    assert state_4h.any_strategy_qualified() == False
+    assert state_15m.any_strategy_qualified() == False
+    
+    # Breakout below qualifies a FALSE BUY on 15M_1M only
+    state_15m.breakout_below_detected = True
+    state_15m.false_buy_qualified = True
+    
+    print(f"  4H_5M qualified: {state_4h.any_strategy_qualified()}")
+    print(f"  15M_1M qualified: {state_15m.any_strategy_qualified()}")
+    print()
+    
+    assert state_4h.any_strategy_qualified() == False
+    assert state_15m.any_strategy_qualified() == True
+    
+    # Resetting the breakout clears its qualified strategies
+    state_15m.reset_breakout_below()
+    assert state_15m.any_strategy_qualified() == False
+    
+    print("✓ Strategy qualification is tracked per range")
+    print()
+
+
+class _NoDataConnector:
+    """Connector stub that has no candle data (processor falls back to empty ranges)"""
+
+    def get_candles(self, symbol, timeframe, count=100):
+        return None
+
+    def get_candles_multi(self, symbol, requests):
+        return {}
+
+
+def test_range_priority():
+    """Test that the candle processor evaluates ranges in priority order"""
+    from src.strategy.multi_range_candle_processor import MultiRangeCandleProcessor
+
+    print("=" * 70)
+    print("TEST 6: Range Priority")
+    print("=" * 70)
+    
+    range_4h = RangeConfig(
+        range_id="4H_5M",
+        reference_timeframe="H4",
+        breakout_timeframe="M5"
+    )
+    range_15m = RangeConfig(
+        range_id="15M_1M",
+        reference_timeframe="M15",
+        breakout_timeframe="M1",
+        priority=-1
+    )
+    range_30m = RangeConfig(
+        range_id="30M_5M",
+        reference_timeframe="M30",
+        breakout_timeframe="M5"
+    )
+    
+    # Lower priorities are checked first, equal priorities keep configured order
+    processor = MultiRangeCandleProcessor("EURUSD", _NoDataConnector(), [range_4h, range_15m, range_30m])
+    ordered = list(processor.get_all_range_ids())
+    
+    print(f"  Check order: {ordered}")
+    print()
+    
+    assert range_4h.priority == 0
+    assert ordered == ["15M_1M", "4H_5M", "30M_5M"]
+    
+    print("✓ Range priority orders evaluation")
+    print()
+
+
+def test_trade_signal_slots():
+    """Test that trade signals carry no per-instance __dict__"""
+    print("=" * 70)
+    print("TEST 7: Trade Signal Slots")
+    print("=" * 70)
+    
+    signal = TradeSignal(
+        symbol="EURUSD", signal_type=PositionType.SELL, entry_price=1.1000,
+        stop_loss=1.1050, take_profit=1.0900, lot_size=0.0,
+        timestamp=datetime(2024, 1, 1, 8, 5, tzinfo=timezone.utc), range_id="4H_5M"
+    )
+    # dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+    if sys.version_info >= (3, 10):
+        assert not hasattr(signal, '__dict__')
+    
+    # Risk manager still adjusts the lot size in place
+    signal.lot_size = 0.5
+    assert signal.lot_size == 0.5
+    assert abs(signal.risk_reward_ratio - 2.0) < 1e-9
+    
+    print("✓ TradeSignal is slotted (Python 3.10+) and remains mutable")
+    print()
+
+
 if __name__ == "__main__":
     print("\n")
     print("*" * 70)
@@ -199,6 +306,9 @@ if __name__ == "__main__":
     test_multi_range_state()
     test_independent_signal_generation()
     test_range_reset()
+    test_strategy_qualification_tracking()
+    test_range_priority()
+    test_trade_signal_slots()
     
     print("=" * 70)
     print("ALL TESTS PASSED ✓")